@@ -1,47 +1,89 @@
+import asyncio
 import requests
+import httpx
 import logging
 import time
 from typing import Dict, Any, Optional, List
-from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+POOL_SIZE = 32
+# Fail fast when the backend is down; allow long reads, since linking indexes the whole file
+CONNECT_TIMEOUT_SECONDS = 5.0
+READ_TIMEOUT_SECONDS = 300.0
+TIMEOUT_ERROR = "Timeout Error: Backend did not respond in time"
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
 class RAGAPIClient:
     def __init__(self, base_url: str = "http://localhost:8000/api/v1"):
         self.base_url = base_url
         self.current_user_id: Optional[str] = None
-
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        url = f"{self.base_url}{endpoint}"
-        start_time = time.time()
-
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+        # Keep-alive pool shared by every sync call instead of a new connection per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            # Retry connect errors (the request never reached the server) but never read errors:
+            # a POST that timed out may already have been uploaded or indexed. allowed_methods keeps
+            # every other retry to idempotent verbs
+            max_retries=Retry(total=3, read=0, backoff_factor=0.1, allowed_methods=IDEMPOTENT_METHODS)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def _add_user_header(self, kwargs: Dict[str, Any]) -> None:
         # Add x-user-id header if current user is set
         if self.current_user_id:
             if "headers" not in kwargs:
                 kwargs["headers"] = {}
             kwargs["headers"]["x-user-id"] = self.current_user_id
 
-        try:
-            logger.info(f"API Call: {method} {url} (user: {self.current_user_id})")
-            response = requests.request(method, url, **kwargs)
-
-            elapsed_time = round((time.time() - start_time) * 1000, 2)
-            logger.info(f"Response: {response.status_code} in {elapsed_time}ms")
+    @staticmethod
+    def _decode_json(response) -> Any:
+        # Both requests and httpx responses expose the raw body as .content
+        return orjson.loads(response.content) if orjson else response.json()
+
+    def _handle_response(self, response, start_time: int) -> Dict[str, Any]:
+        # Lazy %-formatting: nothing is formatted when INFO is filtered out
+        logger.info("Response: %s in %.2fms", response.status_code, (time.perf_counter_ns() - start_time) / 1e6)
+
+        if response.status_code in [200, 207]:
+            return {"success": True, "data": self._decode_json(response), "status_code": response.status_code}
+        else:
+            error_msg = f"API Error: {response.status_code}"
+            try:
+                error_detail = self._decode_json(response)
+                error_msg += f" - {error_detail}"
+            except:
+                error_msg += f" - {response.text}"
 
-            if response.status_code in [200, 207]:
-                return {"success": True, "data": response.json(), "status_code": response.status_code}
-            else:
-                error_msg = f"API Error: {response.status_code}"
-                try:
-                    error_detail = response.json()
-                    error_msg += f" - {error_detail}"
-                except:
-                    error_msg += f" - {response.text}"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg, "status_code": response.status_code}
 
-                logger.error(error_msg)
-                return {"success": False, "error": error_msg, "status_code": response.status_code}
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        url = f"{self.base_url}{endpoint}"
+        start_time = time.perf_counter_ns()
+        self._add_user_header(kwargs)
 
+        try:
+            logger.info("API Call: %s %s (user: %s)", method, url, self.current_user_id)
+            kwargs.setdefault("timeout", (CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS))
+            response = self._session.request(method, url, **kwargs)
+            return self._handle_response(response, start_time)
+
+        except requests.exceptions.Timeout:
+            logger.error(TIMEOUT_ERROR)
+            return {"success": False, "error": TIMEOUT_ERROR, "status_code": 0}
         except requests.exceptions.ConnectionError:
             error_msg = "Connection Error: Could not connect to backend API"
             logger.error(error_msg)
@@ -51,6 +93,35 @@ class RAGAPIClient:
             logger.error(error_msg)
             return {"success": False, "error": error_msg, "status_code": 0}
 
+    async def _make_request_async(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        url = f"{self.base_url}{endpoint}"
+        start_time = time.perf_counter_ns()
+        self._add_user_header(kwargs)
+
+        # One pooled client for concurrent calls; created lazily on the caller's event loop
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(READ_TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS),
+                limits=httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE)
+            )
+
+        try:
+            logger.info("API Call: %s %s (user: %s)", method, url, self.current_user_id)
+            response = await self._async_client.request(method, url, **kwargs)
+            return self._handle_response(response, start_time)
+
+        except httpx.TimeoutException:
+            logger.error(TIMEOUT_ERROR)
+            return {"success": False, "error": TIMEOUT_ERROR, "status_code": 0}
+        except httpx.ConnectError:
+            error_msg = "Connection Error: Could not connect to backend API"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg, "status_code": 0}
+        except Exception as e:
+            error_msg = f"Request Error: {str(e)}"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg, "status_code": 0}
+
     def set_user(self, user_id: Optional[str]):
         self.current_user_id = user_id
         logger.info(f"Current user set to: {user_id or 'None (session user)'}")
@@ -72,10 +143,17 @@ class RAGAPIClient:
     def get_user(self, user_id: str) -> Dict[str, Any]:
         return self._make_request("GET", f"/users/{user_id}")
 
-    def upload_file(self, file_content: bytes, filename: str) -> Dict[str, Any]:
-        files = [("files", (filename, BytesIO(file_content), "application/octet-stream"))]
-        # x-user-id header is automatically added by _make_request
-        return self._make_request("POST", "/files", files=files)
+    def upload_file(self, file_path: str, filename: str) -> Dict[str, Any]:
+        with open(file_path, "rb") as fh:
+            files = [("files", (filename, fh, "application/octet-stream"))]
+            # x-user-id header is automatically added by _make_request
+            return self._make_request("POST", "/files", files=files)
+
+    async def upload_file_async(self, file_path: str, filename: str) -> Dict[str, Any]:
+        # httpx streams multipart file parts in chunks, so the upload is never held in memory whole
+        with open(file_path, "rb") as fh:
+            files = [("files", (filename, fh, "application/octet-stream"))]
+            return await self._make_request_async("POST", "/files", files=files)
 
     def list_files(self) -> Dict[str, Any]:
         # x-user-id header is automatically added by _make_request
@@ -89,6 +167,14 @@ class RAGAPIClient:
         # x-user-id header is automatically added by _make_request
         return self._make_request("DELETE", f"/files/{file_id}")
 
+    async def get_ui_state_async(self) -> Dict[str, Dict[str, Any]]:
+        """File and collection listings for the UI, fetched concurrently (one round trip of latency)"""
+        files_response, collections_response = await asyncio.gather(
+            self._make_request_async("GET", "/files"),
+            self._make_request_async("GET", "/collections")
+        )
+        return {"files": files_response, "collections": collections_response}
+
     def list_collections(self) -> Dict[str, Any]:
         # x-user-id header is automatically added by _make_request
         return self._make_request("GET", "/collections")
@@ -119,12 +205,18 @@ class RAGAPIClient:
         # x-user-id header is automatically added by _make_request
         return self._make_request("POST", f"/{collection_name}/unlink-content", json=file_ids)
 
+    async def link_content_async(self, collection_name: str, files: List[Dict[str, str]]) -> Dict[str, Any]:
+        return await self._make_request_async("POST", f"/{collection_name}/link-content", json=files)
+
+    async def unlink_content_async(self, collection_name: str, file_ids: List[str]) -> Dict[str, Any]:
+        return await self._make_request_async("POST", f"/{collection_name}/unlink-content", json=file_ids)
+
     def query_collection(self, collection_name: str, query: str = "", enable_critic: bool = True, structured_output: bool = False) -> Dict[str, Any]:
         data = {"query": query, "enable_critic": enable_critic, "structured_output": structured_output}
         # x-user-id header is automatically added by _make_request
         return self._make_request("POST", f"/{collection_name}/query", json=data)
 
-    def get_collection_embeddings(self, collection_name: str, limit: int = 100, offset: Optional[str] = None, include_vectors: bool = False) -> Dict[str, Any]:
+    def get_collection_embeddings(self, collection_name: str, limit: int = 100, offset: Optional[str] = None, include_vectors: bool = False, vector_dtype: Optional[str] = None) -> Dict[str, Any]:
         """Retrieve all embeddings from a collection with pagination"""
         params = {}
         if limit:
@@ -133,6 +225,8 @@ class RAGAPIClient:
             params["offset"] = offset
         if include_vectors:
             params["include_vectors"] = "true"
+        if vector_dtype:
+            params["vector_dtype"] = vector_dtype
 
         # x-user-id header is automatically added by _make_request
         return self._make_request("GET", f"/{collection_name}/embeddings", params=params)
@@ -1,68 +1,140 @@
 import sys
-import threading
+import atexit
+import queue
+import socket
 import time
 import logging
+import logging.handlers
+import http.client
+from typing import Callable, Optional
 from pathlib import Path
 
-# Setup paths first
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+# Setup paths first; skipped when PYTHONPATH already provides src/ (as the Docker images do)
+src_path = str(Path(__file__).resolve().parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 # Import config after setting up paths
 from config import Config
 
-log_level = getattr(logging, Config.app.LOG_LEVEL, logging.INFO)
+log_level = logging.getLevelNamesMapping().get(Config.app.LOG_LEVEL.upper(), logging.INFO)
+
+# Hot paths only enqueue records; a single listener thread does the formatting and stdout write
+log_queue = queue.SimpleQueue()
+stdout_handler = logging.StreamHandler(sys.stdout)
+stdout_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, stdout_handler, respect_handler_level=True)
+
+# The queue side only merges args into the message; basicConfig would otherwise give it the
+# default "LEVEL:name:msg" formatter and the listener's handler would format the record twice
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
 logging.basicConfig(
     level=log_level,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[queue_handler]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 
 logger = logging.getLogger(__name__)
 logger.info(f"🔧 Logging configured at {Config.app.LOG_LEVEL} level")
 
+def wait_for_fastapi(host: str = "127.0.0.1", port: int = 8000, timeout: float = 10.0,
+                     is_alive: Optional[Callable[[], bool]] = None) -> bool:
+    """Block until the FastAPI backend answers /health, or until timeout expires or is_alive() turns False."""
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        if is_alive is not None and not is_alive():
+            logger.warning("⚠️ FastAPI backend exited before becoming ready")
+            return False
+        try:
+            # Cheap TCP probe first; only issue the HTTP request once the socket is accepting
+            with socket.create_connection((host, port), timeout=0.1):
+                pass
+            conn = http.client.HTTPConnection(host, port, timeout=1.0)
+            try:
+                conn.request("GET", "/health")
+                if conn.getresponse().status == 200:
+                    return True
+            finally:
+                conn.close()
+        except (OSError, http.client.HTTPException):
+            pass
+        time.sleep(0.05)
+
+    logger.warning(f"⚠️ FastAPI not ready on {host}:{port} after {timeout}s")
+    return False
+
 def run_fastapi():
+    """API-only server; gradio_run.py runs this in a separate backend process."""
     import uvicorn
-    from main import app
+    from main import app as api_app
 
-    logger.info("🚀 Starting FastAPI on port 8000...")
+    logger.info(f"🚀 Starting FastAPI on port {Config.app.API_PORT}...")
     uvicorn.run(
-        app,
-        host="0.0.0.0",
-        port=8000,
-        log_level=Config.app.LOG_LEVEL.lower()
+        api_app,
+        host=Config.app.API_HOST,
+        port=Config.app.API_PORT,
+        loop="uvloop",
+        http="httptools",
+        log_level=Config.app.LOG_LEVEL.lower(),
+        log_config=None,
+        access_log=Config.app.ACCESS_LOG
     )
 
-def run_gradio():
-    logger.info("⏳ Waiting for FastAPI to start...")
-    time.sleep(3)
+def main():
+    logger.info("🚀 Starting RAG Engine...")
+    # sys._is_gil_enabled only exists on 3.13+; older interpreters always hold the GIL
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    logger.info(f"🧵 Python {sys.version.split()[0]} (GIL {'enabled' if gil_enabled else 'disabled'})")
 
-    logger.info("🎉 Starting Gradio on port 7860...")
+    import uvicorn
+    import gradio as gr
+    from main import app as api_app
     from gradio_ui import RAGGradioUI
-    ui = RAGGradioUI()
-    demo = ui.create_interface()
-
-    demo.launch(
-        server_name="0.0.0.0",
-        server_port=7860,
-        share=False,
-        quiet=False,
-        inbrowser=False
+    from api_client import api_client
+    from api.api_constants import API_PREFIX
+    from starlette.responses import RedirectResponse
+
+    # The UI calls the API over loopback on whatever port this server binds
+    api_client.base_url = f"http://127.0.0.1:{Config.app.SERVER_PORT}{API_PREFIX}"
+
+    # Serve the Gradio UI from the FastAPI app so both share one uvicorn server and event loop.
+    # Gradio keeps queue/session state in-process, so this entrypoint must stay single-worker;
+    # scale the API-only image (Dockerfile) with WEB_CONCURRENCY instead.
+    demo = RAGGradioUI().create_interface()
+    demo.queue(
+        max_size=Config.app.GRADIO_QUEUE_MAX_SIZE,
+        default_concurrency_limit=Config.app.GRADIO_CONCURRENCY_LIMIT
     )
+    gr.mount_gradio_app(api_app, demo, path="/ui")
 
-def main():
-    logger.info("🚀 Starting RAG Engine...")
+    async def app(scope, receive, send):
+        # Browsers opening the Space root get the UI; API clients still get the JSON index at /
+        if scope["type"] == "http" and scope["path"] == "/" and b"text/html" in dict(scope["headers"]).get(b"accept", b""):
+            await RedirectResponse("/ui/")(scope, receive, send)
+            return
+        await api_app(scope, receive, send)
 
-    fastapi_thread = threading.Thread(target=run_fastapi, daemon=True)
-    fastapi_thread.start()
+    logger.info(f"🎉 Serving API and Gradio UI (/ui) on port {Config.app.SERVER_PORT}...")
+    server_config = uvicorn.Config(
+        app,
+        host=Config.app.API_HOST,
+        port=Config.app.SERVER_PORT,
+        loop="uvloop",
+        http="httptools",
+        log_level=Config.app.LOG_LEVEL.lower(),
+        log_config=None,  # propagate uvicorn logs to the root queue handler
+        access_log=Config.app.ACCESS_LOG,
+        timeout_graceful_shutdown=5
+    )
+    server = uvicorn.Server(server_config)
 
-    try:
-        run_gradio()
-    except KeyboardInterrupt:
-        logger.info("👋 Shutting down...")
-        sys.exit(0)
+    # server.run() traps SIGINT/SIGTERM and flips server.should_exit, so shutdown drains
+    # in-flight requests and runs the lifespan shutdown instead of killing the process
+    server.run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,26 +1,66 @@
-import gradio as gr
-from app import logger
-from gradio_ui import RAGGradioUI
-
-logger.info("Starting Gradio frontend...")
-try:
-    from gradio_ui import RAGGradioUI
-    ui = RAGGradioUI()
-    demo = ui.create_interface()
-
-    logger.info("🎉 Launching Gradio UI on port 7860...")
-    demo.launch(
-        server_name="0.0.0.0",
-        server_port=7860,
-        share=False,
-        debug=False,
-        show_error=True,
-        show_api=False,
-        quiet=False,
-        inbrowser=True
-    )
-
-except Exception as e:
-    logger.error(f"Failed to start Gradio: {e}")
+import sys
+import signal
+import threading
+import multiprocessing
+from app import logger, wait_for_fastapi, run_fastapi
+from config import Config
+
+
+def main():
+    logger.info("Starting Gradio frontend...")
+
+    # Ctrl-C/SIGTERM just flag shutdown; teardown then runs on the main thread below
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    # Backend gets its own interpreter (and GIL); spawn so the child sets up its own log listener
+    fastapi_process = multiprocessing.get_context("spawn").Process(target=run_fastapi, daemon=True)
+    fastapi_process.start()
+
+    try:
+        logger.info("⏳ Waiting for FastAPI backend...")
+        ready = wait_for_fastapi(port=Config.app.API_PORT, timeout=120.0, is_alive=fastapi_process.is_alive)
+        if not ready or not fastapi_process.is_alive():
+            logger.error(f"❌ FastAPI backend failed to start (exitcode={fastapi_process.exitcode})")
+            fastapi_process.terminate()
+            sys.exit(1)
+
+        from gradio_ui import RAGGradioUI
+        from api_client import api_client
+        from api.api_constants import API_PREFIX
+
+        api_client.base_url = f"http://127.0.0.1:{Config.app.API_PORT}{API_PREFIX}"
+        ui = RAGGradioUI()
+        demo = ui.create_interface()
+        demo.queue(
+            max_size=Config.app.GRADIO_QUEUE_MAX_SIZE,
+            default_concurrency_limit=Config.app.GRADIO_CONCURRENCY_LIMIT
+        )
+
+        logger.info("🎉 Launching Gradio UI on port 7860...")
+        demo.launch(
+            server_name="0.0.0.0",
+            server_port=7860,
+            share=False,
+            debug=False,
+            show_error=True,
+            show_api=False,
+            inbrowser=False,
+            prevent_thread_lock=True
+        )
+        stop.wait()
+
+    except Exception:
+        logger.exception("Failed to start Gradio")
+        fastapi_process.terminate()
+        sys.exit(1)
+
+    logger.info("👋 Shutting down...")
+    demo.close()
     fastapi_process.terminate()
-    sys.exit(1)
\ No newline at end of file
+    fastapi_process.join(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,56 @@
+import asyncio
+import os
+import time
 import gradio as gr
-import pandas as pd
-import json
-from typing import List, Dict, Any, Optional, Tuple
-from api_client import api_client
+from types import MappingProxyType
+from typing import AsyncIterator, List, Dict, Any, Mapping, Optional, Tuple
+from api_client import api_client, TIMEOUT_ERROR
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Gradio resolves handler annotations at runtime, so they can't name
+# pandas.DataFrame without importing pandas (imported on first use below)
+DataFrame = Any
+
+FILES_PAGE_SIZE = 50
+MAX_CHAT_TURNS = 100
+REFRESH_MAX_AGE_SECONDS = 2.0
+
+# Backend link/unlink messages -> short labels for the per-file status list
+_ERROR_MAPPINGS: Mapping[str, str] = MappingProxyType({
+    "File not found": "File missing",
+    "File already linked, unlink first": "Already linked",
+    "Could not read file content": "File unreadable",
+    "Failed to generate embedding": "Processing failed",
+    "Failed to link content to collection": "Database error",
+    "File not found in collection": "Not linked",
+    "Failed to unlink content from collection": "Database error",
+    TIMEOUT_ERROR: "Timed out",
+})
+_SYSTEM_ERROR_PREFIXES: Tuple[str, ...] = ("Internal error:",)
+# Fields a files-table row needs; file_type is only set for supported extensions
+_FILE_RECORD_FIELDS: Tuple[str, ...] = ("file_id", "filename", "file_size", "upload_date")
+_SUCCESS_STATUS: Mapping[str, str] = MappingProxyType({"link": "✅ LINKED", "unlink": "❌ UNLINKED"})
+
+
+def _translate_error_message(backend_message: str) -> str:
+    return _ERROR_MAPPINGS.get(backend_message) or (
+        "System error" if backend_message.startswith(_SYSTEM_ERROR_PREFIXES) else "Operation failed"
+    )
+
+
+def _format_file_status(response: Dict[str, Any], operation: str) -> str:
+    filename = response.get("name", "unknown_file")
+    if response.get("status_code", 500) == 200:
+        return f"{filename} {_SUCCESS_STATUS.get(operation, _SUCCESS_STATUS['unlink'])}"
+    return f"{filename} ❌ {_translate_error_message(response.get('message', 'Failed')).upper()}"
+
 # Custom CSS for clean white UI with small fonts and enhanced delete styling
 custom_css = """
 .gradio-container {
@@ -61,17 +105,32 @@ custom_css = """
 """
 
 class RAGGradioUI:
+    __slots__ = (
+        "current_files", "current_collections", "chat_history", "last_query", "last_collection",
+        "last_doc_ids", "current_user", "_ui_state_cache", "_ui_state_pending",
+        "_file_choices_cache", "_choice_index", "_id_index", "_collection_choices_cache",
+        "_default_user_ready", "_default_user_lock",
+    )
+
     def __init__(self):
         self.current_files = []
         self.current_collections = []
+        self._ui_state_cache: Dict[str, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+        self._ui_state_pending: Dict[str, asyncio.Future] = {}
+        self._file_choices_cache: List[str] = []
+        self._choice_index: Dict[str, Dict[str, Any]] = {}
+        self._id_index: Dict[str, Dict[str, Any]] = {}
+        self._collection_choices_cache: List[str] = []
         self.chat_history = []
         self.last_query = None
         self.last_collection = None
         self.last_doc_ids = []
-        self.current_user = "nakul_test"  # Default user
-        self._ensure_default_user()
+        self.current_user = "nakul_test"  # Default user; created on first page load
+        self._default_user_ready = False
+        self._default_user_lock = asyncio.Lock()
+        api_client.set_user(self.current_user)
 
-    def _ensure_default_user(self):
+    def _ensure_default_user(self) -> bool:
         try:
             response = api_client.get_user(self.current_user)
             if not response["success"]:
@@ -84,15 +143,27 @@ class RAGGradioUI:
                     logger.info(f"Created default user: {self.current_user}")
                 else:
                     logger.error(f"Failed to create default user: {create_response.get('error')}")
+                    return False
 
             api_client.set_user(self.current_user)
             logger.info(f"Set default user: {self.current_user}")
+            return True
         except Exception as e:
             logger.error(f"Error ensuring default user: {e}")
+            return False
+
+    async def _ensure_default_user_once(self):
+        # Page loads from several tabs share one get/create; a failure is retried on the next load
+        if self._default_user_ready:
+            return
+        async with self._default_user_lock:
+            if not self._default_user_ready:
+                self._default_user_ready = await asyncio.to_thread(self._ensure_default_user)
+
+    async def _load_user_choices(self) -> List[str]:
+        return await asyncio.to_thread(self._get_user_choices)
 
     def _get_user_choices(self) -> List[str]:
-        import time
-        time.sleep(10)  
         try:
             response = api_client.list_users()
             if response["success"]:
@@ -112,11 +183,21 @@ class RAGGradioUI:
             api_client.set_user(user_id)
             logger.info(f"Switched to user: {user_id}")
 
-    def switch_user_and_refresh(self, user_id: str):
+    async def switch_user_and_refresh(self, user_id: str):
         self.change_user(user_id)
-        files_df, file_dropdown = self.refresh_files()
-        collections_df, _, _, _, _ = self.refresh_collections()
-        return files_df, file_dropdown, collections_df
+        files_df, collections_df = await self._refresh_state()
+        # Choices for the new user arrive when the dropdown is next opened
+        return files_df, gr.update(value=None), collections_df, 0, gr.update(value=1)
+
+    async def _refresh_state(self, max_age: float = 0.0, page: int = 0) -> Tuple[DataFrame, DataFrame]:
+        """Fetch files and collections in one round trip and update both lists.
+
+        With ``max_age`` set, a listing for the same user that is in flight or
+        younger than ``max_age`` seconds is reused, so refresh-button spam
+        collapses onto one backend call. Paths that just changed data pass 0.
+        """
+        state = await self._get_ui_state(max_age)
+        return self._update_file_list(state["files"], page), self._update_collection_list(state["collections"])
 
     def _format_response(self, response: Dict[str, Any]) -> str:
         if response["success"]:
@@ -126,28 +207,71 @@ class RAGGradioUI:
         else:
             return f"❌ {response['error']}"
 
-    def _update_file_list(self) -> pd.DataFrame:
-        response = api_client.list_files()
+    async def _get_ui_state(self, max_age: float) -> Dict[str, Dict[str, Any]]:
+        user_id = self.current_user
+        if max_age > 0:
+            cached = self._ui_state_cache.get(user_id)
+            if cached and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+            pending = self._ui_state_pending.get(user_id)
+            if pending is not None:
+                return await asyncio.shield(pending)
+
+        task = asyncio.ensure_future(api_client.get_ui_state_async())
+        self._ui_state_pending[user_id] = task
+        try:
+            state = await asyncio.shield(task)
+        finally:
+            if self._ui_state_pending.get(user_id) is task:
+                del self._ui_state_pending[user_id]
+        if all(response["success"] for response in state.values()):
+            self._ui_state_cache[user_id] = (time.monotonic(), state)
+        return state
+
+    def _update_file_list(self, response: Dict[str, Any], page: int = 0) -> DataFrame:
+        import pandas as pd
+
         if response["success"]:
             files_data = response["data"].get("body", {}).get("files", [])
-            self.current_files = files_data
-
-            if files_data:
-                df = pd.DataFrame(files_data)
-                df = df[["filename", "file_size", "upload_date", "file_id"]]
-                df["file_size"] = df["file_size"].apply(lambda x: f"{x:,} bytes")
-                df["upload_date"] = pd.to_datetime(df["upload_date"]).dt.strftime("%Y-%m-%d %H:%M")
-                return df
-            else:
-                return pd.DataFrame({"Message": ["No files uploaded yet"]})
+            self._set_current_files(files_data)
+            return self._files_page_frame(page)
         else:
             return pd.DataFrame({"Error": [response["error"]]})
 
-    def _update_collection_list(self) -> pd.DataFrame:
-        response = api_client.list_collections()
+    def _clamp_files_page(self, page: int) -> int:
+        last_page = max(len(self.current_files) - 1, 0) // FILES_PAGE_SIZE
+        return min(max(page, 0), last_page)
+
+    def _files_page_frame(self, page: int = 0) -> DataFrame:
+        # Only the requested page goes over the websocket, however many files the user has
+        import pandas as pd
+
+        if not self.current_files:
+            return pd.DataFrame({"Message": ["No files uploaded yet"]})
+
+        start = self._clamp_files_page(page) * FILES_PAGE_SIZE
+        rows = self.current_files[start:start + FILES_PAGE_SIZE]
+
+        df = pd.DataFrame(rows, columns=["filename", "file_size", "upload_date", "file_id"])
+        df["file_size"] = df["file_size"].map("{:,} bytes".format)
+        df["upload_date"] = pd.to_datetime(df["upload_date"], format="ISO8601", utc=True).dt.strftime("%Y-%m-%d %H:%M")
+        return df
+
+    def _files_page_outputs(self, page: int) -> Tuple[int, Dict[str, Any]]:
+        # The page lives in per-session gr.State; the Number shows it 1-based after clamping
+        page = self._clamp_files_page(page)
+        return page, gr.update(value=page + 1)
+
+    async def page_files(self, page_number: Optional[float]) -> Tuple[DataFrame, int, Dict[str, Any]]:
+        page = int(page_number or 1) - 1
+        return (self._files_page_frame(page),) + self._files_page_outputs(page)
+
+    def _update_collection_list(self, response: Dict[str, Any]) -> DataFrame:
+        import pandas as pd
+
         if response["success"]:
             collections_data = response["data"].get("body", {}).get("collections", [])
-            self.current_collections = collections_data
+            self._set_current_collections(collections_data)
 
             if collections_data:
                 df = pd.DataFrame({"Collection Name": collections_data})
@@ -157,44 +281,67 @@ class RAGGradioUI:
         else:
             return pd.DataFrame({"Error": [response["error"]]})
 
+    @staticmethod
+    def _file_choice(file: Dict[str, Any]) -> str:
+        return f"{file['filename']} ({file['file_id'][:8]}...)"
+
+    def _set_current_files(self, files: List[Dict[str, Any]]):
+        # Dropdown choices are derived once per refresh, not once per dropdown
+        self.current_files = files
+        self._choice_index = {self._file_choice(file): file for file in files}
+        self._id_index = {file['file_id']: file for file in files}
+        self._file_choices_cache = list(self._choice_index)
+
+    def _add_file(self, file: Dict[str, Any]):
+        # Apply an upload to the cached lists instead of re-listing every file
+        choice = self._file_choice(file)
+        self.current_files = self.current_files + [file]
+        self._choice_index[choice] = file
+        self._id_index[file['file_id']] = file
+        self._file_choices_cache = self._file_choices_cache + [choice]
+        self._ui_state_cache.pop(self.current_user, None)
+
+    def _remove_file(self, file_id: str):
+        file = self._id_index.pop(file_id, None)
+        if file is None:
+            return
+        choice = self._file_choice(file)
+        self.current_files = [f for f in self.current_files if f is not file]
+        self._choice_index.pop(choice, None)
+        self._file_choices_cache = [c for c in self._file_choices_cache if c != choice]
+        self._ui_state_cache.pop(self.current_user, None)
+
+    def _set_current_collections(self, collections: List[str]):
+        self.current_collections = collections
+        self._collection_choices_cache = list(collections)
+
     def _get_file_choices(self) -> List[str]:
-        if self.current_files:
-            return [f"{file['filename']} ({file['file_id'][:8]}...)" for file in self.current_files]
-        return ["No files available"]
+        return self._file_choices_cache
 
     def _get_file_id_from_choice(self, choice: str) -> Optional[str]:
-        if not choice or choice == "No files available":
-            return None
-
-        for file in self.current_files:
-            if choice.startswith(file['filename']):
-                return file['file_id']
-        return None
+        file = self._choice_index.get(choice) if choice else None
+        return file['file_id'] if file else None
 
     def _get_collection_choices(self) -> List[str]:
-        if self.current_collections:
-            return self.current_collections
-        return ["No collections available"]
+        return self._collection_choices_cache
 
-    def _get_collection_from_choice(self, choice: str) -> Optional[str]:
-        if not choice or choice == "No collections available":
-            return None
-        return choice
+    async def file_choices_update(self) -> Dict[str, Any]:
+        return gr.update(choices=self._file_choices_cache)
+
+    async def collection_choices_update(self) -> Dict[str, Any]:
+        return gr.update(choices=self._collection_choices_cache)
 
     def _format_structured_response(self, response_data: Dict[str, Any]) -> str:
-        formatted_json = json.dumps(response_data, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            formatted_json = orjson.dumps(response_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        else:
+            import json
+
+            formatted_json = json.dumps(response_data, indent=2, ensure_ascii=False)
         return f"```json\n{formatted_json}\n```"
 
     def _get_file_ids_from_choices(self, choices: List[str]) -> List[str]:
-        file_ids = []
-        for choice in choices:
-            if not choice or choice == "No files available":
-                continue
-            for file in self.current_files:
-                if choice.startswith(file['filename']):
-                    file_ids.append(file['file_id'])
-                    break
-        return file_ids
+        return [self._choice_index[choice]['file_id'] for choice in choices if choice in self._choice_index]
 
     def _format_multi_operation_response(self, responses: List[Dict], operation: str) -> str:
         if not responses:
@@ -211,122 +358,100 @@ class RAGGradioUI:
         else:
             return f"⚠️ {success_count} {operation}ed, {failed_count} failed"
 
-    def _translate_error_message(self, backend_message: str, operation: str) -> str:
-        error_mappings = {
-            "File not found": "File missing",
-            "File already linked, unlink first": "Already linked",
-            "Could not read file content": "File unreadable",
-            "Failed to generate embedding": "Processing failed",
-            "Failed to link content to collection": "Database error",
-            "File not found in collection": "Not linked",
-            "Failed to unlink content from collection": "Database error",
-        }
-
-        if backend_message in error_mappings:
-            return error_mappings[backend_message]
-
-        if backend_message.startswith("Internal error:"):
-            return "System error"
-
-        return "Operation failed"
+    def _collect_fanout_results(self, responses: List[Dict[str, Any]], names: List[str]) -> List[Dict]:
+        results = []
+        for name, response in zip(names, responses):
+            if response["success"] and response["status_code"] == 207:
+                results.extend(response.get("data", []))
+            else:
+                results.append({
+                    "name": name,
+                    "status_code": response.get("status_code") or 500,
+                    "message": response.get("error", "Failed")
+                })
+        return results
 
     def _format_file_status_list(self, responses: List[Dict], operation: str) -> str:
         if not responses:
             return f"❌ No {operation} operations performed"
 
-        status_lines = []
-        for response in responses:
-            filename = response.get("name", "unknown_file")
-            status_code = response.get("status_code", 500)
+        return "\n".join(_format_file_status(response, operation) for response in responses)
 
-            if status_code == 200:
-                if operation == "link":
-                    status_lines.append(f"{filename} ✅ LINKED")
-                else: 
-                    status_lines.append(f"{filename} ❌ UNLINKED")
-            else:
-                backend_message = response.get("message", "Failed")
-                user_friendly_message = self._translate_error_message(backend_message, operation)
-                status_lines.append(f"{filename} ❌ {user_friendly_message.upper()}")
-
-        return "\n".join(status_lines)
-
-    def upload_file(self, file) -> Tuple[str, pd.DataFrame, gr.Dropdown, gr.Dropdown]:
+    async def upload_file(self, file, page: int) -> Tuple[str, DataFrame, Dict[str, Any], int, Dict[str, Any]]:
         if file is None:
-            return "⚠️ Please select a file to upload", self._update_file_list(), gr.Dropdown(choices=self._get_file_choices()), gr.Dropdown(choices=self._get_file_choices())
+            files_df, _ = await self._refresh_state(page=page)
+            return ("⚠️ Please select a file to upload", files_df, gr.update(choices=self._get_file_choices())) + self._files_page_outputs(page)
 
         try:
-            file_content = file.read() if hasattr(file, 'read') else open(file.name, 'rb').read()
-            filename = file.name.split('/')[-1] if hasattr(file, 'name') else 'uploaded_file'
-            response = api_client.upload_file(file_content, filename)
-
-            updated_df = self._update_file_list()
-            updated_choices = self._get_file_choices()
-
-            return self._format_response(response), updated_df, gr.Dropdown(choices=updated_choices, value=None), gr.Dropdown(choices=updated_choices, value=None, multiselect=True)
+            # gr.File hands over a temp-file path (older Gradio: a tempfile wrapper with .name)
+            file_path = file if isinstance(file, str) else file.name
+            filename = os.path.basename(file_path) or 'uploaded_file'
+            response = await api_client.upload_file_async(file_path, filename)
+
+            # The backend returns the stored file's listing record; re-list if it is incomplete
+            record = response["data"].get("body", {}) if response["success"] else {}
+            if all(record.get(field) is not None for field in _FILE_RECORD_FIELDS):
+                self._add_file(record)
+                updated_df = self._files_page_frame(page)
+            else:
+                updated_df, _ = await self._refresh_state(page=page)
+            return (self._format_response(response), updated_df, gr.update(choices=self._get_file_choices(), value=None)) + self._files_page_outputs(page)
 
         except Exception as e:
             logger.error(f"File upload error: {e}")
-            choices = self._get_file_choices()
-            return f"❌ Upload failed: {str(e)}", self._update_file_list(), gr.Dropdown(choices=choices), gr.Dropdown(choices=choices, multiselect=True)
+            files_df, _ = await self._refresh_state(page=page)
+            return (f"❌ Upload failed: {str(e)}", files_df, gr.update(choices=self._get_file_choices())) + self._files_page_outputs(page)
 
 
-    def delete_file(self, file_choice: str) -> Tuple[str, pd.DataFrame, gr.Dropdown, gr.Dropdown]:
+    async def delete_file(self, file_choice: str, page: int) -> Tuple[str, DataFrame, Dict[str, Any], int, Dict[str, Any]]:
         file_id = self._get_file_id_from_choice(file_choice)
 
         if not file_id:
-            choices = self._get_file_choices()
-            return "⚠️ Please select a file to delete", self._update_file_list(), gr.Dropdown(choices=choices), gr.Dropdown(choices=choices, multiselect=True)
+            files_df, _ = await self._refresh_state(page=page)
+            return ("⚠️ Please select a file to delete", files_df, gr.update(choices=self._get_file_choices())) + self._files_page_outputs(page)
 
-        response = api_client.delete_file(file_id)
-
-        updated_df = self._update_file_list()
-        updated_choices = self._get_file_choices()
+        response = await asyncio.to_thread(api_client.delete_file, file_id)
 
-        return self._format_response(response), updated_df, gr.Dropdown(choices=updated_choices, value=None), gr.Dropdown(choices=updated_choices, value=None, multiselect=True)
+        if response["success"]:
+            self._remove_file(file_id)
+            updated_df = self._files_page_frame(page)
+        else:
+            updated_df, _ = await self._refresh_state(page=page)
+        return (self._format_response(response), updated_df, gr.update(choices=self._get_file_choices(), value=None)) + self._files_page_outputs(page)
 
 
-    def refresh_files(self) -> Tuple[pd.DataFrame, gr.Dropdown]:
-        updated_df = self._update_file_list()
+    async def refresh_files(self, page: int) -> Tuple[DataFrame, Dict[str, Any], int, Dict[str, Any]]:
+        updated_df, _ = await self._refresh_state(REFRESH_MAX_AGE_SECONDS, page)
         updated_choices = self._get_file_choices()
-        return updated_df, gr.Dropdown(choices=updated_choices, value=None)
-
-    def refresh_collections(self) -> Tuple[pd.DataFrame, gr.Dropdown, gr.Dropdown, gr.Dropdown, gr.Dropdown]:
-        updated_df = self._update_collection_list()
-        updated_choices = self._get_collection_choices()
-        return (updated_df,
-                gr.Dropdown(choices=updated_choices, value=None),
-                gr.Dropdown(choices=updated_choices, value=None),
-                gr.Dropdown(choices=updated_choices, value=None),
-                gr.Dropdown(choices=updated_choices, value=None))
-
-    def create_collection(self, collection_name: str) -> Tuple[str, pd.DataFrame, gr.Dropdown, gr.Dropdown, gr.Dropdown, gr.Dropdown]:
+        return (updated_df, gr.update(choices=updated_choices, value=None)) + self._files_page_outputs(page)
+
+    async def refresh_collections(self) -> Tuple[DataFrame, Dict[str, Any]]:
+        _, updated_df = await self._refresh_state(REFRESH_MAX_AGE_SECONDS)
+        return updated_df, gr.update(choices=self._get_collection_choices(), value=None)
+
+    async def create_collection(self, collection_name: str) -> Tuple[str, DataFrame, Dict[str, Any]]:
         if not collection_name.strip():
-            choices = self._get_collection_choices()
-            return ("⚠️ Please enter a collection name", self._update_collection_list(),
-                    gr.Dropdown(choices=choices), gr.Dropdown(choices=choices), gr.Dropdown(choices=choices), gr.Dropdown(choices=choices))
+            _, collections_df = await self._refresh_state()
+            dropdown_update = gr.update(choices=self._get_collection_choices())
+            return "⚠️ Please enter a collection name", collections_df, dropdown_update
 
-        response = api_client.create_collection(collection_name.strip())
-        updated_df = self._update_collection_list()
-        updated_choices = self._get_collection_choices()
+        response = await asyncio.to_thread(api_client.create_collection, collection_name.strip())
+        _, updated_df = await self._refresh_state()
+        dropdown_update = gr.update(choices=self._get_collection_choices(), value=None)
 
-        return (self._format_response(response), updated_df,
-                gr.Dropdown(choices=updated_choices, value=None),
-                gr.Dropdown(choices=updated_choices, value=None),
-                gr.Dropdown(choices=updated_choices, value=None),
-                gr.Dropdown(choices=updated_choices, value=None))
+        return self._format_response(response), updated_df, dropdown_update
 
-    def delete_collection(self, collection_choice: str) -> Tuple[str, pd.DataFrame, gr.Dropdown, gr.Dropdown, gr.Dropdown, gr.Dropdown]:
-        collection_name = self._get_collection_from_choice(collection_choice)
+    async def delete_collection(self, collection_choice: str) -> Tuple[str, DataFrame, Dict[str, Any]]:
+        collection_name = collection_choice or None
 
         if not collection_name:
-            choices = self._get_collection_choices()
-            return ("⚠️ Please select a collection to delete", self._update_collection_list(),
-                    gr.Dropdown(choices=choices), gr.Dropdown(choices=choices), gr.Dropdown(choices=choices), gr.Dropdown(choices=choices))
+            _, collections_df = await self._refresh_state()
+            dropdown_update = gr.update(choices=self._get_collection_choices())
+            return "⚠️ Please select a collection to delete", collections_df, dropdown_update
 
         # Add a warning prefix to let user know this is permanent
         try:
-            response = api_client.delete_collection(collection_name)
+            response = await asyncio.to_thread(api_client.delete_collection, collection_name)
             if response["success"]:
                 status_message = f"🗑️ Collection '{collection_name}' deleted permanently"
             else:
@@ -334,17 +459,13 @@ class RAGGradioUI:
         except Exception as e:
             status_message = f"❌ Error deleting collection: {str(e)}"
 
-        updated_df = self._update_collection_list()
-        updated_choices = self._get_collection_choices()
+        _, updated_df = await self._refresh_state()
+        dropdown_update = gr.update(choices=self._get_collection_choices(), value=None)
 
-        return (status_message, updated_df,
-                gr.Dropdown(choices=updated_choices, value=None),
-                gr.Dropdown(choices=updated_choices, value=None),
-                gr.Dropdown(choices=updated_choices, value=None),
-                gr.Dropdown(choices=updated_choices, value=None))
+        return status_message, updated_df, dropdown_update
 
-    def link_content(self, collection_choice: str, file_choices: List[str]) -> str:
-        collection_name = self._get_collection_from_choice(collection_choice)
+    async def link_content(self, collection_choice: str, file_choices: List[str]) -> str:
+        collection_name = collection_choice or None
         if not collection_name:
             return "⚠️ Please select a collection"
 
@@ -357,32 +478,25 @@ class RAGGradioUI:
 
         files_to_link = []
         for file_id in file_ids:
-            selected_file = None
-            for file in self.current_files:
-                if file['file_id'] == file_id:
-                    selected_file = file
-                    break
-
-            if selected_file:
-                files_to_link.append({
-                    "name": selected_file['filename'],
-                    "file_id": file_id,
-                    "type": selected_file.get('file_type', 'text')
-                })
+            selected_file = self._id_index[file_id]
+            files_to_link.append({
+                "name": selected_file['filename'],
+                "file_id": file_id,
+                "type": selected_file.get('file_type', 'text')
+            })
 
         if not files_to_link:
             return "⚠️ No valid files to link"
 
-        response = api_client.link_content(collection_name, files_to_link)
-
-        if response["success"] and response["status_code"] == 207:
-            results = response.get("data", [])
-            return self._format_file_status_list(results, "link")
-        else:
-            return self._format_response(response)
+        # One request per file so the backend indexes the files concurrently
+        responses = await asyncio.gather(*[
+            api_client.link_content_async(collection_name, [file_item]) for file_item in files_to_link
+        ])
+        results = self._collect_fanout_results(responses, [file_item["name"] for file_item in files_to_link])
+        return self._format_file_status_list(results, "link")
 
-    def unlink_content(self, collection_choice: str, file_choices: List[str]) -> str:
-        collection_name = self._get_collection_from_choice(collection_choice)
+    async def unlink_content(self, collection_choice: str, file_choices: List[str]) -> str:
+        collection_name = collection_choice or None
         if not collection_name:
             return "⚠️ Please select a collection"
 
@@ -393,16 +507,14 @@ class RAGGradioUI:
         if not file_ids:
             return "⚠️ Selected files not found"
 
-        response = api_client.unlink_content(collection_name, file_ids)
-
-        if response["success"] and response["status_code"] == 207:
-            results = response.get("data", [])
-            return self._format_file_status_list(results, "unlink")
-        else:
-            return self._format_response(response)
+        responses = await asyncio.gather(*[
+            api_client.unlink_content_async(collection_name, [file_id]) for file_id in file_ids
+        ])
+        results = self._collect_fanout_results(responses, [self._id_index[file_id]['filename'] for file_id in file_ids])
+        return self._format_file_status_list(results, "unlink")
 
     def query_collection(self, collection_choice: str, query: str) -> str:
-        collection_name = self._get_collection_from_choice(collection_choice)
+        collection_name = collection_choice or None
         if not collection_name:
             return "⚠️ Please select a collection"
 
@@ -428,31 +540,35 @@ class RAGGradioUI:
         else:
             return self._format_response(response)
 
-    def chat_with_collection(self, collection_choice: str, message: str, history: List, structured_output: bool = False, enable_critic: bool = True) -> Tuple[List, str]:
-        if history is None:
-            history = []
+    async def chat_with_collection(self, collection_choice: str, message: str, history: List, structured_output: bool = False, enable_critic: bool = True) -> AsyncIterator[Tuple[List, str]]:
+        # Older turns are dropped so the history Gradio re-sends each turn stays bounded
+        history = (history or [])[-(MAX_CHAT_TURNS - 1):]
 
         if not message.strip():
-            return history, ""
+            yield history, ""
+            return
 
-        collection_name = self._get_collection_from_choice(collection_choice)
+        collection_name = collection_choice or None
         if not collection_name:
             history.append(["❌ Please select a collection first", ""])
-            return history, ""
+            yield history, ""
+            return
 
         history.append([message, ""])
+        # Show the question (and clear the input) while the backend is answering
+        yield history, ""
 
         actual_enable_critic = enable_critic and structured_output
 
-        response = api_client.query_collection(collection_name, message.strip(), actual_enable_critic, structured_output)
+        response = await asyncio.to_thread(api_client.query_collection, collection_name, message.strip(), actual_enable_critic, structured_output)
 
         if response["success"]:
             data = response.get("data", {})
 
             self.last_query = message.strip()
             self.last_collection = collection_name
-            chunks = data.get("chunks", [])
-            self.last_doc_ids = [chunk.get("source", "") for chunk in chunks if chunk.get("source")]
+            chunks = data.get("chunks")
+            self.last_doc_ids = [chunk["source"] for chunk in chunks if chunk.get("source")] if chunks else []
 
             if structured_output:
                 if not actual_enable_critic and "critic" in data:
@@ -470,9 +586,9 @@ class RAGGradioUI:
             self.last_collection = None
             self.last_doc_ids = []
 
-        return history, ""
+        yield history, ""
 
-    def clear_chat(self) -> List:
+    async def clear_chat(self) -> List:
         self.last_query = None
         self.last_collection = None
         self.last_doc_ids = []
@@ -497,16 +613,17 @@ class RAGGradioUI:
         except Exception as e:
             return f"❌ Error submitting feedback: {str(e)}"
 
-    def rate_good(self) -> str:
-        return self.submit_feedback(1)
+    async def rate_good(self) -> str:
+        return await asyncio.to_thread(self.submit_feedback, 1)
 
-    def rate_bad(self) -> str:
-        return self.submit_feedback(0)
+    async def rate_bad(self) -> str:
+        return await asyncio.to_thread(self.submit_feedback, 0)
 
-    def toggle_feedback_visibility(self, feedback_enabled: bool) -> gr.Row:
+    # UI-only handlers below are async so they run on the event loop rather than a worker thread
+    async def toggle_feedback_visibility(self, feedback_enabled: bool) -> gr.Row:
         return gr.Row(visible=feedback_enabled)
 
-    def update_critic_toggle_visibility(self, structured_output: bool) -> gr.Checkbox:
+    async def update_critic_toggle_visibility(self, structured_output: bool) -> gr.Checkbox:
         if structured_output:
             return gr.Checkbox(visible=True, value=True, interactive=True)
         else:
@@ -552,8 +669,18 @@ class RAGGradioUI:
                             files_table = gr.Dataframe(
                                 headers=["Filename", "Size", "Upload Date", "File ID"],
                                 interactive=False,
-                                wrap=True
+                                wrap=True,
+                                height=500
+                            )
+                            files_page = gr.Number(
+                                label="Page",
+                                value=1,
+                                minimum=1,
+                                precision=0,
+                                info=f"{FILES_PAGE_SIZE} files per page"
                             )
+                            # Zero-based page per browser session; the UI object itself is shared
+                            files_page_state = gr.State(0)
 
                             with gr.Row():
                                 file_selector = gr.Dropdown(
@@ -706,45 +833,62 @@ class RAGGradioUI:
                             )
 
             # Event handlers for File Management
+            # Slow backend work (upload, collection creation, linking/embedding, chat) goes
+            # through the queue so the launcher's concurrency limit applies; UI-only events skip it
             upload_btn.click(
                 fn=self.upload_file,
-                inputs=[file_upload],
-                outputs=[upload_status, files_table, file_selector, link_file_dropdown],
-                queue=False
+                inputs=[file_upload, files_page_state],
+                outputs=[upload_status, files_table, file_selector, files_page_state, files_page],
+                queue=True
             )
 
             delete_btn.click(
                 fn=self.delete_file,
-                inputs=[file_selector],
-                outputs=[upload_status, files_table, file_selector, link_file_dropdown],
+                inputs=[file_selector, files_page_state],
+                outputs=[upload_status, files_table, file_selector, files_page_state, files_page],
                 queue=False
             )
 
             refresh_files_btn.click(
                 fn=self.refresh_files,
-                outputs=[files_table, file_selector],
+                inputs=[files_page_state],
+                outputs=[files_table, file_selector, files_page_state, files_page],
+                queue=False
+            )
+
+            files_page.change(
+                fn=self.page_files,
+                inputs=[files_page],
+                outputs=[files_table, files_page_state, files_page],
                 queue=False
             )
 
             create_collection_btn.click(
                 fn=self.create_collection,
                 inputs=[collection_name],
-                outputs=[collection_status, collections_table, delete_collection_dropdown, link_collection_dropdown, unlink_collection_dropdown, chat_collection_dropdown],
-                queue=False
+                outputs=[collection_status, collections_table, delete_collection_dropdown],
+                queue=True
             )
 
             delete_collection_btn.click(
                 fn=self.delete_collection,
                 inputs=[delete_collection_dropdown],
-                outputs=[collection_status, collections_table, delete_collection_dropdown, link_collection_dropdown, unlink_collection_dropdown, chat_collection_dropdown],
+                outputs=[collection_status, collections_table, delete_collection_dropdown],
                 queue=False
             )
 
+            # Dropdowns receive choices when opened, so page loads and refreshes
+            # don't ship the full file/collection lists to every dropdown
+            for dropdown in (file_selector, link_file_dropdown, unlink_file_dropdown):
+                dropdown.focus(fn=self.file_choices_update, outputs=[dropdown], queue=False)
+            for dropdown in (delete_collection_dropdown, link_collection_dropdown, unlink_collection_dropdown, chat_collection_dropdown):
+                dropdown.focus(fn=self.collection_choices_update, outputs=[dropdown], queue=False)
+
             link_btn.click(
                 fn=self.link_content,
                 inputs=[link_collection_dropdown, link_file_dropdown],
                 outputs=[link_status],
-                queue=False
+                queue=True
             )
 
             unlink_btn.click(
@@ -756,7 +900,7 @@ class RAGGradioUI:
 
             refresh_collections_btn.click(
                 fn=self.refresh_collections,
-                outputs=[collections_table, delete_collection_dropdown, link_collection_dropdown, unlink_collection_dropdown, chat_collection_dropdown],
+                outputs=[collections_table, delete_collection_dropdown],
                 queue=False
             )
 
@@ -764,14 +908,14 @@ class RAGGradioUI:
                 fn=self.chat_with_collection,
                 inputs=[chat_collection_dropdown, chat_input, chatbot, structured_output_toggle, critic_toggle],
                 outputs=[chatbot, chat_input],
-                queue=False
+                queue=True
             )
 
             chat_input.submit(
                 fn=self.chat_with_collection,
                 inputs=[chat_collection_dropdown, chat_input, chatbot, structured_output_toggle, critic_toggle],
                 outputs=[chatbot, chat_input],
-                queue=False
+                queue=True
             )
 
             clear_chat_btn.click(
@@ -810,24 +954,23 @@ class RAGGradioUI:
             user_dropdown.change(
                 fn=self.switch_user_and_refresh,
                 inputs=[user_dropdown],
-                outputs=[files_table, file_selector, collections_table],
+                outputs=[files_table, file_selector, collections_table, files_page_state, files_page],
                 queue=False
             )
 
             # Initialize with current data on load
-            def initialize_data():
-                files_df, file_choices = self.refresh_files()
-                collections_df, delete_dropdown, link_dropdown, unlink_dropdown, chat_dropdown = self.refresh_collections()
-                user_choices = self._get_user_choices()
-                return (gr.Dropdown(choices=user_choices, value=self.current_user), files_df, file_choices, collections_df,
-                        gr.Dropdown(choices=self._get_file_choices(), multiselect=True),
-                        gr.Dropdown(choices=self._get_file_choices(), multiselect=True),
-                        delete_dropdown, link_dropdown, unlink_dropdown, chat_dropdown)
+            async def initialize_data():
+                # The listings are per user, so the default user must exist before they run
+                await self._ensure_default_user_once()
+                user_choices, (files_df, collections_df) = await asyncio.gather(
+                    self._load_user_choices(),
+                    self._refresh_state()
+                )
+                return gr.update(choices=user_choices, value=self.current_user), files_df, collections_df
 
             demo.load(
                 fn=initialize_data,
-                outputs=[user_dropdown, files_table, file_selector, collections_table, link_file_dropdown,
-                        unlink_file_dropdown, delete_collection_dropdown, link_collection_dropdown, unlink_collection_dropdown, chat_collection_dropdown],
+                outputs=[user_dropdown, files_table, collections_table],
                 queue=False
             )
 
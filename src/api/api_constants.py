@@ -3,6 +3,7 @@ COLLECTION_STATUS = "/collection/status"
 LINK_CONTENT = "/link-content"
 UNLINK_CONTENT = "/unlink-content"
 QUERY_COLLECTION = "/query"
+EMBEDDINGS = "/embeddings"
 BATCH_READ_FILES = "/files/batch-read"
 CONFIG_BASE = "/config"
 FILES_BASE = "/files"
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, HTTPException, Response, Query, Header, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional, Union
 from api.api_constants import *
-from models.api_models import LinkContentItem, LinkContentResponse, QueryRequest, QueryResponse, UnlinkContentResponse, ApiResponse
-from services.collection_service import CollectionService
+from models.api_models import LinkContentItem, LinkContentResponse, QueryRequest, QueryResponse, UnlinkContentResponse, ApiResponse, GetEmbeddingsResponse
+from services.collection_service import collection_service
+from utils.vector_codec import VectorDtype
 
 router = APIRouter()
-collection_service = CollectionService()
 
 @router.post("/{collection_name}" + LINK_CONTENT)
 def link_content(collection_name: str, files: List[LinkContentItem], response: Response, x_user_id: str = Header(...)) -> List[LinkContentResponse]:
@@ -26,11 +27,11 @@ def unlink_content(collection_name: str, file_ids: List[str], response: Response
     return collection_service.unlink_content(collection_name, file_ids, x_user_id)
 
 @router.post("/{collection_name}" + QUERY_COLLECTION)
-def query_collection(collection_name: str, request: QueryRequest, background_tasks: BackgroundTasks, x_user_id: str = Header(...)) -> QueryResponse:
+async def query_collection(collection_name: str, request: QueryRequest, background_tasks: BackgroundTasks, x_user_id: str = Header(...)) -> QueryResponse:
     """
     Query the vector store, filtering by the logical collection name.
     """
-    return collection_service.query_collection(
+    return await collection_service.query_collection(
         x_user_id,
         collection_name,
         request.query,
@@ -39,6 +40,28 @@ def query_collection(collection_name: str, request: QueryRequest, background_tas
         background_tasks
     )
 
+@router.get("/{collection_name}" + EMBEDDINGS, response_model=GetEmbeddingsResponse)
+def get_collection_embeddings(
+    collection_name: str,
+    x_user_id: str = Header(...),
+    limit: int = Query(100, ge=1, le=500),
+    offset: Optional[str] = None,
+    include_vectors: bool = False,
+    vector_dtype: VectorDtype = "fp16"
+) -> ORJSONResponse:
+    """
+    Page through the stored chunks of a logical collection.
+    Vectors are only included on request, fp16-encoded by default to keep pages small.
+    The page is serialized directly; the repository already returns the documented shape,
+    so re-validating up to 500 items through the response model is skipped.
+    """
+    body = collection_service.get_collection_embeddings(
+        x_user_id, collection_name, limit, offset, include_vectors, vector_dtype
+    )
+    if "error" in body:
+        raise HTTPException(status_code=500, detail=body["error"])
+    return ORJSONResponse(content={"status": "SUCCESS", "message": "Embeddings retrieved successfully", "body": body})
+
 @router.post("/purge")
 def purge_user_data(x_user_id: str = Header(...)) -> ApiResponse:
     """
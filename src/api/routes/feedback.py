@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, BackgroundTasks
 from models.api_models import FeedbackRequest, FeedbackResponse
 from services.feedback_service import FeedbackService
 
@@ -6,21 +6,23 @@ router = APIRouter()
 feedback_service = FeedbackService()
 
 @router.post("/feedback")
-def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
-    success = feedback_service.save_feedback(
+def submit_feedback(request: FeedbackRequest, background_tasks: BackgroundTasks) -> FeedbackResponse:
+    if not feedback_service.accepts(request.label):
+        return FeedbackResponse(
+            status="FAILURE",
+            message="Failed to save feedback"
+        )
+
+    # Embedding and persisting the feedback happen after the response is sent
+    background_tasks.add_task(
+        feedback_service.save_feedback,
         query=request.query,
         doc_ids=request.doc_ids,
         label=request.label,
         collection=request.collection
     )
 
-    if success:
-        return FeedbackResponse(
-            status="SUCCESS",
-            message="Feedback saved successfully"
-        )
-    else:
-        return FeedbackResponse(
-            status="FAILURE",
-            message="Failed to save feedback"
-        )
\ No newline at end of file
+    return FeedbackResponse(
+        status="SUCCESS",
+        message="Feedback queued"
+    )
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Header
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, UploadFile, File, Header, Request, Response
+from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
 import logging
+import os
 from api.api_constants import *
 from models.api_models import ApiResponse, ApiResponseWithBody, FileUploadResponse
 from services.file_service import file_service
@@ -36,34 +38,46 @@ def get_file(file_id: str, x_user_id: str = Header(...)) -> ApiResponse:
     return ApiResponse(status="SUCCESS", message=f"File '{file_id}' retrieved successfully")
 
 @router.get(FILES_BASE + "/{file_id}/content")
-def get_file_content(file_id: str, x_user_id: str = Header(...)):
+def get_file_content(file_id: str, request: Request, x_user_id: str = Header(...)):
     """
-    Stream file content with proper MIME type and Content-Disposition headers.
-    Returns raw file bytes for direct viewing (PDFs) or downloading.
+    Serve file content with proper MIME type and Content-Disposition headers.
+    Returns raw file bytes for direct viewing (PDFs) or downloading, or 304
+    when the client's If-None-Match still matches the file's ETag.
     """
     # validate_user(x_user_id)
 
-    # Get file stream and metadata
-    result = file_service.stream_file_content(file_id, x_user_id)
+    # The ETag comes from stored metadata, so a revalidation never downloads the file
+    etag = file_service.get_file_etag(file_id, x_user_id)
+    if not etag:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    cache_control = "public, max-age=3600, immutable"  # Cache for 1 hour
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+    # Resolve to a local file so the server can send it without copying through Python
+    result = file_service.resolve_file_content(file_id, x_user_id)
 
     if not result:
         raise HTTPException(status_code=404, detail="File not found")
 
-    content_stream, content_type, filename = result
+    file_path, content_type, filename, is_temporary = result
 
     # Create response headers for proper file handling
     headers = {
-        "Content-Type": content_type,
         "Content-Disposition": f'inline; filename="{filename}"',
-        "Cache-Control": "public, max-age=3600",  # Cache for 1 hour
+        "Cache-Control": cache_control,
+        "ETag": etag,
     }
 
     logger.info(f"Serving file content: {filename} ({content_type}) for user {x_user_id}")
 
-    return StreamingResponse(
-        content=content_stream,
+    return FileResponse(
+        file_path,
         headers=headers,
-        media_type=content_type
+        media_type=content_type,
+        background=BackgroundTask(os.remove, file_path) if is_temporary else None
     )
 
 @router.delete(FILES_BASE + "/{file_id}")
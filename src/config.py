@@ -7,6 +7,8 @@ class QdrantConfig:
     HOST: str = os.getenv("QDRANT_HOST", "localhost")
     PORT: int = int(os.getenv("QDRANT_PORT", "6333"))
     TIMEOUT: int = int(os.getenv("QDRANT_TIMEOUT", "30"))
+    PREFER_GRPC: bool = os.getenv("QDRANT_PREFER_GRPC", "false").lower() == "true"
+    GRPC_PORT: int = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
     API_KEY: str = os.getenv("QDRANT_API_KEY", "")
     COLLECTION_NAME: str = os.getenv("QDRANT_COLLECTION_NAME", "knowledge_base")
 
@@ -37,28 +39,51 @@ class LlmConfig:
 class AppConfig:
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    ACCESS_LOG: bool = os.getenv("ACCESS_LOG", "false").lower() == "true"
 
     API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
     API_PORT: int = int(os.getenv("API_PORT", "8000"))
+    # Combined API + UI server (app.py), the Hugging Face Space entrypoint: Spaces route to 7860
+    SERVER_PORT: int = int(os.getenv("PORT") or os.getenv("GRADIO_SERVER_PORT") or "7860")
     UPLOADS_DIR: str = os.getenv("UPLOADS_DIR", "uploads")
     MAX_FILE_SIZE_MB: int = int(os.getenv("MAX_FILE_SIZE_MB", "100"))
+    # uvicorn worker count (read by the Dockerfile CMD too); workers split the CPU cores between their torch pools
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    # Gradio queue: bound pending events and concurrent handler runs per event
+    GRADIO_QUEUE_MAX_SIZE: int = int(os.getenv("GRADIO_QUEUE_MAX_SIZE", "64"))
+    GRADIO_CONCURRENCY_LIMIT: int = int(os.getenv("GRADIO_CONCURRENCY_LIMIT", "8"))
     
     # CORS Configuration
-    CORS_ALLOWED_ORIGINS: list = os.getenv(
+    CORS_ALLOWED_ORIGINS: tuple = tuple(origin.strip() for origin in os.getenv(
         "CORS_ALLOWED_ORIGINS",
         "http://localhost:3000,http://localhost:7860,http://localhost:5173,https://parkho-ai-frontend-ku7bn6e62q-uc.a.run.app,https://parkho-ai-frontend-846780462763.us-central1.run.app,https://ai-content-tutor-ku7bn6e62q-uc.a.run.app,https://ai-content-tutor-846780462763.us-central1.run.app,http://13.236.51.35:3000,http://13.236.51.35:8080"
-    ).split(",")
+    ).split(",") if origin.strip())
+    CORS_ALLOWED_METHODS: tuple = tuple(method.strip().upper() for method in os.getenv(
+        "CORS_ALLOWED_METHODS", "GET,POST,PUT,PATCH,DELETE,OPTIONS"
+    ).split(",") if method.strip())
+    CORS_ALLOWED_HEADERS: tuple = tuple(header.strip() for header in os.getenv(
+        "CORS_ALLOWED_HEADERS", "Authorization,Content-Type,X-User-Id,If-None-Match"
+    ).split(",") if header.strip())
 
 class RerankingConfig:
     RERANKER_ENABLED: bool = os.getenv("RERANKER_ENABLED", "true").lower() == "true"
     RERANKER_MODEL: str = os.getenv("RERANKER_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2")
     RERANKER_TOP_K: int = int(os.getenv("RERANKER_TOP_K", "5"))
+    RERANKER_BATCH_SIZE: int = int(os.getenv("RERANKER_BATCH_SIZE", "64"))
+    RERANKER_MAX_LENGTH: int = int(os.getenv("RERANKER_MAX_LENGTH", "512"))
 
 class CriticConfig:
     CRITIC_ENABLED: bool = os.getenv("CRITIC_ENABLED", "false").lower() == "true"
     CRITIC_MODEL_NAME: str = os.getenv("CRITIC_MODEL_NAME", "models/gemini-2.5-flash")
     CRITIC_MODEL_API_KEY: str = os.getenv("CRITIC_MODEL_API_KEY", "")
     CRITIC_MODEL_TEMPERATURE: float = float(os.getenv("CRITIC_MODEL_TEMPERATURE", "0.1"))
+    # ~12k tokens at ~4 characters per token
+    CRITIC_MAX_CONTEXT_CHARS: int = int(os.getenv("CRITIC_MAX_CONTEXT_CHARS", "48000"))
+    # Thinking tokens count against the output cap on 2.5 models; 0 turns thinking off
+    # (Flash only, Pro models need a positive budget and a larger cap)
+    CRITIC_THINKING_BUDGET: int = int(os.getenv("CRITIC_THINKING_BUDGET", "0"))
+    CRITIC_MAX_OUTPUT_TOKENS: int = int(os.getenv("CRITIC_MAX_OUTPUT_TOKENS", "1024"))
 
 class FeedbackConfig:
     FEEDBACK_ENABLED: bool = os.getenv("FEEDBACK_ENABLED", "true").lower() == "true"
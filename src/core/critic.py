@@ -1,26 +1,73 @@
-import google.generativeai as genai
+from google import genai
+from google.genai import types
+import hashlib
 import json
+import threading
 import time
 import logging
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+EVALUATION_CACHE_SIZE = 1024
+EVALUATION_CACHE_TTL_SECONDS = 3600
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Built once at import; only the three fields are substituted per call
+_EVALUATION_PROMPT = """You are an AI critic evaluating the quality and completeness of a RAG system's answer.
+
+Your task: Analyze if the answer adequately addresses the user's query given the available context.
+
+Query: {query}
+
+Available Context:
+{context}
+
+Generated Answer:
+{answer}
+
+Evaluate the answer and respond with valid JSON only:
+{{
+  "confidence": <float 0.0-1.0>,
+  "missing_info": "<what key information is missing or unclear>",
+  "enrichment_suggestions": ["<topic1>", "<topic2>"]
+}}
+
+Scoring guidelines:
+- confidence 0.9+: Complete, accurate answer
+- confidence 0.7-0.9: Good answer with minor gaps
+- confidence 0.5-0.7: Partial answer, missing key details
+- confidence <0.5: Inadequate or misleading answer
+
+Focus on factual completeness, not writing quality."""
+
 class CriticHead:
     _instance = None
     _model = None
+    _init_lock = threading.Lock()
+    # blake2b(query, answer, context) -> (stored_at, evaluation); retries and eval replays skip the LLM call
+    _cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _cache_lock = threading.Lock()
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
+        with cls._init_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self):
+        with self._init_lock:
+            self._load_model()
+
+    def _load_model(self):
         if self._model is None and Config.critic.CRITIC_MODEL_API_KEY:
             try:
-                genai.configure(api_key=Config.critic.CRITIC_MODEL_API_KEY)
-                self._model = genai.GenerativeModel(Config.critic.CRITIC_MODEL_NAME)
+                # A per-instance client keeps its own pooled HTTP connection and, unlike
+                # genai.configure, doesn't swap the API key used by the answer LLM
+                self._model = genai.Client(api_key=Config.critic.CRITIC_MODEL_API_KEY)
                 logger.info(f"Critic model loaded: {Config.critic.CRITIC_MODEL_NAME}")
             except Exception as e:
                 logger.error(f"Failed to load critic model: {e}")
@@ -30,33 +77,47 @@ class CriticHead:
         if not Config.critic.CRITIC_ENABLED or not self._model:
             return None
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
-            context_text = "\n\n".join(context_chunks)
+            # Bound prompt size (and so latency and cost) however many chunks were retrieved
+            context_text = "\n\n".join(context_chunks)[:Config.critic.CRITIC_MAX_CONTEXT_CHARS]
+
+            cache_key = self._cache_key(query, context_text, answer)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                logger.info("Critic evaluation served from cache")
+                return cached
+
             prompt = self._build_evaluation_prompt(query, context_text, answer)
 
-            response = self._model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=Config.critic.CRITIC_MODEL_TEMPERATURE
+            response = self._model.models.generate_content(
+                model=Config.critic.CRITIC_MODEL_NAME,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    temperature=Config.critic.CRITIC_MODEL_TEMPERATURE,
+                    # The verdict is three small fields: ask for bare JSON and bound its size
+                    response_mime_type="application/json",
+                    max_output_tokens=Config.critic.CRITIC_MAX_OUTPUT_TOKENS,
+                    thinking_config=types.ThinkingConfig(thinking_budget=Config.critic.CRITIC_THINKING_BUDGET)
                 )
             )
 
-            if not response.text or not response.text.strip():
+            # response.text re-joins the candidate parts on every access
+            text = response.text
+            start = text.find("{") if text else -1
+            if start < 0:
+                logger.warning("Critic returned no JSON verdict (finish_reason=%s)", self._finish_reason(response))
                 return None
 
-            # Strip markdown code blocks if present
-            clean_text = response.text.strip()
-            if clean_text.startswith('```json'):
-                clean_text = clean_text[7:]
-            if clean_text.endswith('```'):
-                clean_text = clean_text[:-3]
-            clean_text = clean_text.strip()
-
-            result = json.loads(clean_text)
-            elapsed = time.time() - start_time
-            logger.info(f"Critic evaluation completed in {elapsed:.3f}s")
+            # raw_decode stops at the end of the object, so markdown fences and trailing text are ignored
+            try:
+                result, _ = _JSON_DECODER.raw_decode(text, start)
+            except json.JSONDecodeError as e:
+                logger.warning("Critic verdict is not valid JSON (finish_reason=%s): %s", self._finish_reason(response), e)
+                return None
+            self._put_cached(cache_key, result)
+            logger.info("Critic evaluation completed in %.3fs", (time.perf_counter_ns() - start_time) / 1e9)
 
             return result
 
@@ -64,33 +125,43 @@ class CriticHead:
             logger.error(f"Critic evaluation failed: {e}")
             return None
 
-    def _build_evaluation_prompt(self, query: str, context: str, answer: str) -> str:
-        return f"""You are an AI critic evaluating the quality and completeness of a RAG system's answer.
-
-Your task: Analyze if the answer adequately addresses the user's query given the available context.
-
-Query: {query}
-
-Available Context:
-{context}
-
-Generated Answer:
-{answer}
-
-Evaluate the answer and respond with valid JSON only:
-{{
-  "confidence": <float 0.0-1.0>,
-  "missing_info": "<what key information is missing or unclear>",
-  "enrichment_suggestions": ["<topic1>", "<topic2>"]
-}}
+    @staticmethod
+    def _finish_reason(response: Any) -> Optional[str]:
+        # MAX_TOKENS here means the verdict was cut off by CRITIC_MAX_OUTPUT_TOKENS
+        candidates = getattr(response, "candidates", None)
+        if not candidates:
+            return None
+        reason = candidates[0].finish_reason
+        return getattr(reason, "name", reason)
+
+    @staticmethod
+    def _cache_key(query: str, context: str, answer: str) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (query, answer, context):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.digest()
+
+    def _get_cached(self, key: bytes) -> Optional[Dict[str, Any]]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > EVALUATION_CACHE_TTL_SECONDS:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
 
-Scoring guidelines:
-- confidence 0.9+: Complete, accurate answer
-- confidence 0.7-0.9: Good answer with minor gaps
-- confidence 0.5-0.7: Partial answer, missing key details
-- confidence <0.5: Inadequate or misleading answer
+    def _put_cached(self, key: bytes, result: Dict[str, Any]) -> None:
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > EVALUATION_CACHE_SIZE:
+                self._cache.popitem(last=False)
 
-Focus on factual completeness, not writing quality."""
+    def _build_evaluation_prompt(self, query: str, context: str, answer: str) -> str:
+        return _EVALUATION_PROMPT.format(query=query, context=context, answer=answer)
 
     def is_available(self) -> bool:
         return Config.critic.CRITIC_ENABLED and self._model is not None
@@ -1,11 +1,17 @@
 from sentence_transformers import CrossEncoder
+from collections import OrderedDict
+import threading
 import time
+import numpy as np
+import torch
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+SCORE_CACHE_SIZE = 4096
+
 class Reranker:
     """
     Reranker module for improving document relevance in RAG pipeline.
@@ -15,18 +21,33 @@ class Reranker:
 
     _instance = None
     _model = None
+    # Concurrent first calls from the threadpool must not load the model twice
+    _init_lock = threading.Lock()
+    # (query, document id) -> CrossEncoder score; repeated queries skip inference
+    _score_cache: "OrderedDict[Tuple[str, Any], float]" = OrderedDict()
+    _score_cache_lock = threading.Lock()
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
+        with cls._init_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self):
+        with self._init_lock:
+            self._load_model()
+
+    def _load_model(self):
         if self._model is None:
             try:
                 logger.info(f"Loading reranker model: {Config.reranking.RERANKER_MODEL}")
-                self._model = CrossEncoder(Config.reranking.RERANKER_MODEL)
-                logger.info("Reranker model loaded successfully")
+                # max_length makes the tokenizer truncate long chunks instead of padding every pair to them
+                self._model = CrossEncoder(Config.reranking.RERANKER_MODEL, max_length=Config.reranking.RERANKER_MAX_LENGTH)
+                if torch.cuda.is_available():
+                    # Half precision halves memory traffic and runs on tensor cores
+                    self._model.model.half()
+                self._model.model.eval()
+                logger.info(f"Reranker model loaded successfully on {self._model._target_device}")
             except Exception as e:
                 logger.error(f"Failed to load reranker model: {e}")
                 self._model = None
@@ -43,11 +64,11 @@ class Reranker:
         Returns:
             List of reranked documents, sorted by relevance score
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         # Use config value if top_k not specified
         final_top_k = top_k or Config.reranking.RERANKER_TOP_K
-        logger.info(f"Fetching top {final_top_k} documents")
+        logger.info("Fetching top %d documents", final_top_k)
 
         # If reranker is disabled or model failed to load, return original order
         if not Config.reranking.RERANKER_ENABLED or self._model is None:
@@ -59,33 +80,18 @@ class Reranker:
             return documents[:final_top_k]
 
         try:
-            # Extract text content from documents for scoring
-            document_texts = []
-            for doc in documents:
-                # Try different possible text fields
-                text = doc.get("text") or doc.get("content") or doc.get("payload", {}).get("text", "")
-                if not text:
-                    logger.warning(f"Document missing text content: {doc}")
-                    text = ""
-                document_texts.append(text)
-
-            # Create query-document pairs for the CrossEncoder
-            pairs = [(query, text) for text in document_texts]
+            scores = self._score(query, documents)
 
-            # Get relevance scores from the model
-            scores = self._model.predict(pairs)
-
-            # Combine documents with their scores
-            scored_docs = list(zip(documents, scores))
-
-            # Sort by relevance score (highest first)
-            scored_docs.sort(key=lambda x: x[1], reverse=True)
+            # Select the top k scores in O(n), then order just those (highest first)
+            k = min(final_top_k, scores.size)
+            top_indices = np.argpartition(-scores, k - 1)[:k]
+            top_indices = top_indices[np.argsort(-scores[top_indices], kind="stable")]
 
             # Extract the reranked documents
-            reranked_docs = [doc for doc, score in scored_docs[:final_top_k]]
+            reranked_docs = [documents[i] for i in top_indices]
 
-            elapsed_time = time.time() - start_time
-            logger.info(f"Reranking completed in {elapsed_time:.3f}s for {len(documents)} documents -> {len(reranked_docs)} results")
+            logger.info("Reranking completed in %.3fs for %d documents -> %d results",
+                        (time.perf_counter_ns() - start_time) / 1e9, len(documents), len(reranked_docs))
 
             return reranked_docs
 
@@ -94,6 +100,44 @@ class Reranker:
             # Fallback to original order on error
             return documents[:final_top_k]
 
+    def _score(self, query: str, documents: List[Dict[str, Any]]) -> np.ndarray:
+        """Score documents against the query, running the model only for uncached pairs."""
+        scores = np.empty(len(documents), dtype=np.float32)
+        missing = []
+
+        with self._score_cache_lock:
+            for i, doc in enumerate(documents):
+                cached = self._score_cache.get((query, doc.get("id"))) if doc.get("id") is not None else None
+                if cached is None:
+                    missing.append(i)
+                else:
+                    scores[i] = cached
+
+        if missing:
+            # Documents come from the search path with their text already hoisted to "text"
+            pairs = [(query, documents[i].get("text", "")) for i in missing]
+            # inference_mode skips autograd bookkeeping entirely, not just gradient recording
+            with torch.inference_mode():
+                predicted = self._model.predict(
+                    pairs,
+                    batch_size=Config.reranking.RERANKER_BATCH_SIZE,
+                    show_progress_bar=False,
+                    convert_to_numpy=True
+                )
+            scores[missing] = predicted
+
+            with self._score_cache_lock:
+                for i, score in zip(missing, predicted):
+                    doc_id = documents[i].get("id")
+                    if doc_id is None:
+                        continue
+                    self._score_cache[(query, doc_id)] = float(score)
+                    self._score_cache.move_to_end((query, doc_id))
+                while len(self._score_cache) > SCORE_CACHE_SIZE:
+                    self._score_cache.popitem(last=False)
+
+        return scores
+
     def is_available(self) -> bool:
         """Check if reranker is available and enabled."""
         return Config.reranking.RERANKER_ENABLED and self._model is not None
@@ -1,21 +1,50 @@
+from contextlib import asynccontextmanager
+import os
+import torch
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from api.routes import collections, config, files, feedback
+from services.collection_service import collection_service
+from utils.embedding_client import embedding_batcher
 from config import Config
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # WEB_CONCURRENCY is assumed to equal the uvicorn --workers count, as in the Dockerfile CMD.
+    # app.py always serves from a single process, so leave WEB_CONCURRENCY unset (1) there
+    # or this would needlessly shrink that process's torch pool.
+    if Config.app.WEB_CONCURRENCY > 1:
+        # Each worker's torch pool defaults to every core; with several workers the
+        # reranker and embedder passes oversubscribe the CPU and thrash each other
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // Config.app.WEB_CONCURRENCY))
+    # Pay connection setup and first-inference cost before uvicorn starts accepting requests
+    await run_in_threadpool(collection_service.warm_up)
+    yield
+    await embedding_batcher.close()
+    await run_in_threadpool(feedback.feedback_service.flush)
+    await run_in_threadpool(collection_service.close)
+
 app = FastAPI(
     title="RAG Engine API",
     description="Core engine for uploading, processing, retrieving, and enriching documents using Retrieval-Augmented Generation (RAG)",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # Query and embedding payloads are float-heavy; orjson encodes them far faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
+# Origins as a frozenset make the per-request origin check a hash lookup; the explicit
+# method/header lists are what the routes actually accept (x-user-id identifies the caller)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=Config.app.CORS_ALLOWED_ORIGINS,
+    allow_origins=frozenset(Config.app.CORS_ALLOWED_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=list(Config.app.CORS_ALLOWED_METHODS),
+    allow_headers=list(Config.app.CORS_ALLOWED_HEADERS),
+    expose_headers=["ETag"],
 )
 
 # Include routers
@@ -31,7 +60,7 @@ def read_root():
         "message": "RAG Engine API",
         "version": "1.0.0",
         "docs": "/docs",
-        "gradio_ui": "http://localhost:7860"
+        "gradio_ui": "/ui"
     }
 
 @app.get("/health")
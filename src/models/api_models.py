@@ -1,6 +1,5 @@
 from pydantic import BaseModel, model_validator
-from typing import List, Optional, Any, Dict
-from datetime import datetime
+from typing import List, Optional, Any, Dict, Union
 from enum import Enum
 
 class RagConfig(BaseModel):
@@ -105,31 +104,6 @@ class ChunkConfig(BaseModel):
     source: str
     text: str
 
-class TopicMetadata(BaseModel):
-    chapter_num: Optional[int] = None
-    chapter_title: Optional[str] = None
-    section_num: Optional[str] = None
-    section_title: Optional[str] = None
-    page_start: Optional[int] = None
-    page_end: Optional[int] = None
-
-class ChunkMetadata(BaseModel):
-    chunk_type: ChunkType
-    topic_id: str
-    key_terms: List[str] = []
-    equations: List[str] = []
-    has_equations: bool = False
-    has_diagrams: bool = False
-    difficulty_level: Optional[str] = None
-
-class HierarchicalChunk(BaseModel):
-    chunk_id: str
-    document_id: str
-    topic_metadata: TopicMetadata
-    chunk_metadata: ChunkMetadata
-    text: str
-    embedding_vector: Optional[List[float]] = None
-
 class CriticEvaluation(BaseModel):
     confidence: float
     missing_info: str
@@ -150,16 +124,14 @@ class QueryResponse(BaseModel):
 class FileUploadResponse(BaseModel):
     status: str
     message: str
-    body: Dict[str, str]
+    # file_id, filename, file_size, upload_date (ISO 8601, UTC) and, for supported types, file_type
+    body: Dict[str, Any]
 
 class UnlinkContentResponse(BaseModel):
     file_id: str
     status_code: int
     message: str
 
-class CreateConfigRequest(BaseModel):
-    pass
-
 class CreateConfigResponse(BaseModel):
     message: str
     config_id: str
@@ -180,7 +152,8 @@ class EmbeddingItem(BaseModel):
     text: str
     source: str
     metadata: Dict[str, Any]
-    vector: Optional[List[float]] = None
+    # Plain floats for fp32; fp16/int8 vectors come as {"dtype", "data" (base64), "scale" (int8 only)}
+    vector: Optional[Union[List[float], Dict[str, Any]]] = None
 
 class GetEmbeddingsResponse(BaseModel):
     status: str
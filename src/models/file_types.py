@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import Dict, List
+from types import MappingProxyType
+from typing import List, Mapping
 
 
 class FileType(Enum):
@@ -8,7 +9,7 @@ class FileType(Enum):
 
 
 class FileExtensions:
-    SUPPORTED_EXTENSIONS: Dict[str, FileType] = {
+    SUPPORTED_EXTENSIONS: Mapping[str, FileType] = MappingProxyType({
         '.pdf': FileType.PDF,
         '.txt': FileType.TEXT,
         '.md': FileType.TEXT,
@@ -17,14 +18,14 @@ class FileExtensions:
         '.xml': FileType.TEXT,
         '.html': FileType.TEXT,
         '.htm': FileType.TEXT,
-    }
+    })
 
     @classmethod
     def get_file_type(cls, extension: str) -> FileType:
-        extension_lower = extension.lower()
-        if extension_lower not in cls.SUPPORTED_EXTENSIONS:
+        file_type = cls.SUPPORTED_EXTENSIONS.get(extension.lower())
+        if file_type is None:
             raise UnsupportedFileTypeError(f"Unsupported file extension: {extension}")
-        return cls.SUPPORTED_EXTENSIONS[extension_lower]
+        return file_type
 
     @classmethod
     def is_supported(cls, extension: str) -> bool:
@@ -0,0 +1,43 @@
+"""
+Chunk containers used inside the indexing pipeline.
+
+These never cross the API boundary, so they are plain slotted dataclasses
+rather than Pydantic models: thousands are built per document and none of
+them need validation.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from models.api_models import ChunkType
+
+
+@dataclass(slots=True)
+class TopicMetadata:
+    chapter_num: Optional[int] = None
+    chapter_title: Optional[str] = None
+    section_num: Optional[str] = None
+    section_title: Optional[str] = None
+    page_start: Optional[int] = None
+    page_end: Optional[int] = None
+
+
+@dataclass(slots=True)
+class ChunkMetadata:
+    chunk_type: ChunkType
+    topic_id: str
+    key_terms: List[str] = field(default_factory=list)
+    equations: List[str] = field(default_factory=list)
+    has_equations: bool = False
+    has_diagrams: bool = False
+    difficulty_level: Optional[str] = None
+
+
+@dataclass(slots=True)
+class HierarchicalChunk:
+    chunk_id: str
+    document_id: str
+    topic_metadata: TopicMetadata
+    chunk_metadata: ChunkMetadata
+    text: str
+    embedding_vector: Optional[List[float]] = None
@@ -10,20 +10,26 @@ class FeedbackRepository:
     def __init__(self):
         self.feedback_file = "feedback_data.jsonl"
 
+    def build_entry(self, query: str, query_vector: List[float], doc_ids: List[str],
+                    label: int, collection: str) -> Dict[str, Any]:
+        return {
+            "query": query,
+            "q_vec": query_vector,
+            "doc_ids": doc_ids,
+            "label": label,
+            "collection": collection,
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        }
+
     def save_feedback(self, query: str, query_vector: List[float], doc_ids: List[str],
                      label: int, collection: str) -> bool:
-        try:
-            feedback_entry = {
-                "query": query,
-                "q_vec": query_vector,
-                "doc_ids": doc_ids,
-                "label": label,
-                "collection": collection,
-                "timestamp": datetime.utcnow().isoformat() + "Z"
-            }
+        return self.save_feedback_batch([self.build_entry(query, query_vector, doc_ids, label, collection)])
 
+    def save_feedback_batch(self, entries: List[Dict[str, Any]]) -> bool:
+        try:
+            # One open and one write for the whole batch
             with open(self.feedback_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(feedback_entry) + "\n")
+                f.write("".join(json.dumps(entry) + "\n" for entry in entries))
 
             return True
         except Exception:
@@ -31,11 +37,14 @@ class FeedbackRepository:
 
     def get_relevant_feedback(self, query_vector: List[float], collection: str,
                             similarity_threshold: float = 0.8) -> List[Dict[str, Any]]:
+        return self.rank_feedback(query_vector, self.load_feedback(collection), similarity_threshold)
+
+    def load_feedback(self, collection: str) -> List[Dict[str, Any]]:
+        """Read the stored feedback for a collection; independent of the query vector."""
         if not os.path.exists(self.feedback_file):
             return []
 
-        relevant_feedback = []
-        query_vec = np.array(query_vector)
+        entries = []
 
         try:
             with open(self.feedback_file, "r", encoding="utf-8") as f:
@@ -49,15 +58,27 @@ class FeedbackRepository:
                     if feedback.get("collection") != collection:
                         continue
 
-                    stored_vec = np.array(feedback.get("q_vec", []))
-                    if len(stored_vec) == 0:
+                    if not feedback.get("q_vec"):
                         continue
 
-                    similarity = self._cosine_similarity(query_vec, stored_vec)
+                    entries.append(feedback)
+
+            return entries
+
+        except Exception:
+            return []
+
+    def rank_feedback(self, query_vector: List[float], entries: List[Dict[str, Any]],
+                      similarity_threshold: float = 0.8) -> List[Dict[str, Any]]:
+        relevant_feedback = []
+        query_vec = np.array(query_vector)
+
+        try:
+            for feedback in entries:
+                similarity = self._cosine_similarity(query_vec, np.array(feedback["q_vec"]))
 
-                    if similarity >= similarity_threshold:
-                        feedback["similarity"] = similarity
-                        relevant_feedback.append(feedback)
+                if similarity >= similarity_threshold:
+                    relevant_feedback.append(dict(feedback, similarity=similarity))
 
             relevant_feedback.sort(key=lambda x: x["similarity"], reverse=True)
             return relevant_feedback
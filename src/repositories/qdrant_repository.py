@@ -3,16 +3,36 @@ from qdrant_client.models import (
     VectorParams, Distance, PointStruct, Filter, FieldCondition,
     MatchValue, MatchAny, PayloadSchemaType
 )
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Set, Tuple
+import threading
+import time
 import uuid
 import logging
 from config import Config
+from utils.vector_codec import VectorDtype, encode_vector
 
 logger = logging.getLogger(__name__)
 
+COLLECTION_NAMES_TTL_SECONDS = 5.0
+
 class QdrantRepository:
     def __init__(self):
         host = Config.qdrant.HOST
+        # Collection names change only on create/delete. This process invalidates the cache on
+        # its own creates/deletes, but other workers' changes show up only after the TTL, so
+        # checks that guard a create/delete always refresh it first
+        self._collection_names: Optional[Tuple[float, Set[str]]] = None
+        self._collection_names_lock = threading.Lock()
+        # gRPC multiplexes calls over one long-lived connection with protobuf payloads;
+        # keepalive stops idle load balancers from silently dropping it
+        transport = {}
+        if Config.qdrant.PREFER_GRPC:
+            transport = {
+                "prefer_grpc": True,
+                "grpc_port": Config.qdrant.GRPC_PORT,
+                "grpc_options": {"grpc.keepalive_time_ms": 10000},
+            }
         
         if Config.qdrant.API_KEY:
             # When using API key, use url parameter
@@ -28,7 +48,8 @@ class QdrantRepository:
             self.client = QdrantClient(
                 url=url,
                 api_key=Config.qdrant.API_KEY,
-                timeout=Config.qdrant.TIMEOUT
+                timeout=Config.qdrant.TIMEOUT,
+                **transport
             )
         else:
             # For local connections without API key, extract hostname from URL if needed
@@ -39,15 +60,45 @@ class QdrantRepository:
             self.client = QdrantClient(
                 host=host,
                 port=Config.qdrant.PORT,
-                timeout=Config.qdrant.TIMEOUT
+                timeout=Config.qdrant.TIMEOUT,
+                **transport
             )
 
-    def collection_exists(self, collection_name: str) -> bool:
+    def warm_up(self) -> bool:
+        """Open the connection to Qdrant ahead of the first request."""
+        try:
+            self.client.get_collections()
+            return True
+        except Exception as e:
+            logger.warning(f"Qdrant warm-up failed: {str(e)}")
+            return False
+
+    def close(self) -> None:
+        try:
+            self.client.close()
+        except Exception as e:
+            logger.warning(f"Error closing Qdrant client: {str(e)}")
+
+    def _get_collection_names(self, refresh: bool = False) -> Set[str]:
+        with self._collection_names_lock:
+            cached = self._collection_names
+        if not refresh and cached and time.monotonic() - cached[0] < COLLECTION_NAMES_TTL_SECONDS:
+            return cached[1]
+
+        collections = self.client.get_collections()
+        names = {col.name for col in collections.collections}
+        with self._collection_names_lock:
+            self._collection_names = (time.monotonic(), names)
+        return names
+
+    def _invalidate_collection_names(self) -> None:
+        with self._collection_names_lock:
+            self._collection_names = None
+
+    def collection_exists(self, collection_name: str, refresh: bool = False) -> bool:
         try:
             logger.debug(f"Checking if collection '{collection_name}' exists")
-            collections = self.client.get_collections()
-            collection_names = [col.name for col in collections.collections]
-            exists = collection_name in collection_names
+            exists = collection_name in self._get_collection_names(refresh=refresh)
             logger.debug(f"Collection '{collection_name}' exists: {exists}")
             return exists
         except Exception as e:
@@ -99,6 +150,24 @@ class QdrantRepository:
             logger.error(f"Failed to ensure indexes on collection '{collection_name}': {str(e)}")
             return False
 
+    def ensure_indexes_bulk(self, collection_names: List[str], use_new_schema: bool = False,
+                            max_workers: int = 16) -> Dict[str, bool]:
+        """
+        Ensure payload indexes on many collections at once.
+
+        Collections are independent, so their index requests are dispatched
+        concurrently instead of one collection after another.
+
+        Returns:
+            Mapping of collection name to ensure_indexes() result
+        """
+        if not collection_names:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(collection_names))) as executor:
+            results = executor.map(lambda name: self.ensure_indexes(name, use_new_schema=use_new_schema), collection_names)
+            return dict(zip(collection_names, results))
+
     def _create_single_index(self, collection_name: str, field_name: str, field_schema: str) -> None:
         try:
             self.client.create_payload_index(
@@ -125,18 +194,20 @@ class QdrantRepository:
             True if collection was created, False if it already exists
         """
         try:
-            if self.collection_exists(collection_name):
+            if self.collection_exists(collection_name, refresh=True):
                 logger.info(f"Collection '{collection_name}' already exists")
                 return False
 
-            self.client.create_collection(
-                collection_name=collection_name,
-                vectors_config=VectorParams(
-                    size=Config.embedding.VECTOR_SIZE,
-                    distance=Distance.COSINE
+            try:
+                self.client.create_collection(
+                    collection_name=collection_name,
+                    vectors_config=VectorParams(
+                        size=Config.embedding.VECTOR_SIZE,
+                        distance=Distance.COSINE
+                    )
                 )
-            )
-
+            finally:
+                self._invalidate_collection_names()
             self.ensure_indexes(collection_name, use_new_schema=use_new_schema)
             logger.info(f"Created collection '{collection_name}' with payload indexes")
             return True
@@ -158,24 +229,26 @@ class QdrantRepository:
         logger.info(f"Creating user collection: {collection_name}")
 
         try:
-            if self.collection_exists(collection_name):
+            if self.collection_exists(collection_name, refresh=True):
                 logger.info(f"User collection '{collection_name}' already exists")
                 return False
 
-            self.client.create_collection(
-                collection_name=collection_name,
-                vectors_config=VectorParams(
-                    size=Config.embedding.VECTOR_SIZE,
-                    distance=Distance.COSINE,
-                    on_disk=False  # Keep in memory for better performance
-                ),
-                hnsw_config={
-                    "m": 16,
-                    "ef_construct": 100,
-                    "full_scan_threshold": 10000
-                }
-            )
-
+            try:
+                self.client.create_collection(
+                    collection_name=collection_name,
+                    vectors_config=VectorParams(
+                        size=Config.embedding.VECTOR_SIZE,
+                        distance=Distance.COSINE,
+                        on_disk=False  # Keep in memory for better performance
+                    ),
+                    hnsw_config={
+                        "m": 16,
+                        "ef_construct": 100,
+                        "full_scan_threshold": 10000
+                    }
+                )
+            finally:
+                self._invalidate_collection_names()
             # Create indexes for new schema
             self.ensure_indexes(collection_name, use_new_schema=True)
             logger.info(f"Created user collection '{collection_name}' with new schema and indexes")
@@ -195,11 +268,14 @@ class QdrantRepository:
             True if deletion was successful
         """
         try:
-            if not self.collection_exists(collection_name):
+            if not self.collection_exists(collection_name, refresh=True):
                 logger.warning(f"Collection '{collection_name}' does not exist")
                 return False
 
-            self.client.delete_collection(collection_name)
+            try:
+                self.client.delete_collection(collection_name)
+            finally:
+                self._invalidate_collection_names()
             logger.info(f"Deleted collection '{collection_name}'")
             return True
         except Exception as e:
@@ -243,8 +319,7 @@ class QdrantRepository:
     def list_collections(self) -> List[str]:
         try:
             logger.info("Fetching list of collections from Qdrant")
-            collections = self.client.get_collections()
-            collection_names = [col.name for col in collections.collections]
+            collection_names = sorted(self._get_collection_names())
             logger.debug(f"Found {len(collection_names)} collections: {collection_names}")
             return collection_names
         except Exception as e:
@@ -480,20 +555,39 @@ class QdrantRepository:
             {
                 "id": hit.id,
                 "score": hit.score,
-                "payload": hit.payload
+                "payload": hit.payload,
+                # Hoisted so consumers such as the reranker don't dig through the payload per query
+                "text": (hit.payload or {}).get("text", "")
             }
             for hit in results
         ]
 
-    def get_all_embeddings(self, collection_name: str, limit: int = 100, offset: Optional[str] = None, include_vectors: bool = False) -> Dict[str, Any]:
+    def get_all_embeddings(self, collection_name: str, limit: int = 100, offset: Optional[str] = None, include_vectors: bool = False,
+                           collection_id: Optional[str] = None, vector_dtype: VectorDtype = "fp32") -> Dict[str, Any]:
         try:
             logger.info(f"Retrieving embeddings from collection '{collection_name}' with limit={limit}, include_vectors={include_vectors}")
 
-            collection_info = self.client.get_collection(collection_name)
-            total_count = collection_info.points_count
+            if not self.collection_exists(collection_name):
+                # Nothing has been stored for this user yet
+                return self._empty_embeddings_page()
+
+            scroll_filter = None
+            if collection_id:
+                scroll_filter = Filter(
+                    must=[
+                        FieldCondition(
+                            key="metadata.collection_id",
+                            match=MatchValue(value=collection_id)
+                        )
+                    ]
+                )
+                total_count = self.client.count(collection_name, count_filter=scroll_filter, exact=True).count
+            else:
+                total_count = self.client.get_collection(collection_name).points_count
 
             result = self.client.scroll(
                 collection_name=collection_name,
+                scroll_filter=scroll_filter,
                 limit=limit,
                 offset=offset,
                 with_vectors=include_vectors,
@@ -501,7 +595,7 @@ class QdrantRepository:
             )
 
             points, next_offset = result
-            embeddings = self._format_embeddings(points, include_vectors)
+            embeddings = self._format_embeddings(points, include_vectors, vector_dtype)
 
             logger.info(f"Retrieved {len(embeddings)} embeddings from collection '{collection_name}'")
 
@@ -513,23 +607,25 @@ class QdrantRepository:
                 "collection_info": {
                     "name": collection_name,
                     "points_count": total_count,
-                    "vectors_count": collection_info.vectors_count if hasattr(collection_info, 'vectors_count') else total_count
+                    "vectors_count": total_count
                 }
             }
 
         except Exception as e:
             logger.error(f"Failed to retrieve embeddings from collection '{collection_name}': {str(e)}")
             logger.exception("Full exception details:")
-            return {
-                "embeddings": [],
-                "next_offset": None,
-                "total_count": 0,
-                "has_more": False,
-                "collection_info": {},
-                "error": str(e)
-            }
+            return {**self._empty_embeddings_page(), "error": str(e)}
+
+    def _empty_embeddings_page(self) -> Dict[str, Any]:
+        return {
+            "embeddings": [],
+            "next_offset": None,
+            "total_count": 0,
+            "has_more": False,
+            "collection_info": {}
+        }
 
-    def _format_embeddings(self, points: List[Any], include_vectors: bool) -> List[Dict[str, Any]]:
+    def _format_embeddings(self, points: List[Any], include_vectors: bool, vector_dtype: VectorDtype = "fp32") -> List[Dict[str, Any]]:
         embeddings = []
         for point in points:
             embedding_item = {
@@ -541,7 +637,7 @@ class QdrantRepository:
             }
 
             if include_vectors and point.vector:
-                embedding_item["vector"] = point.vector
+                embedding_item["vector"] = encode_vector(point.vector, vector_dtype)
 
             embeddings.append(embedding_item)
         return embeddings
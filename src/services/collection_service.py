@@ -11,6 +11,7 @@ from utils.embedding_client import embedding_client
 from utils.document_builder import build_qdrant_point
 from models.api_models import LinkContentItem, LinkContentResponse, UnlinkContentResponse, QueryResponse
 from parsers.parser_factory import ParserFactory
+from utils.vector_codec import VectorDtype
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -20,13 +21,25 @@ class CollectionService:
         logger.info("Initializing CollectionService")
         self.qdrant_repo = QdrantRepository()
         self.embedding_client = embedding_client
-        self.query_service = QueryService()
+        # Share one Qdrant client (and its connection pool) with the query path
+        self.query_service = QueryService(qdrant_repo=self.qdrant_repo)
+
+    def warm_up(self) -> None:
+        """Establish vector store connections and run one embedding pass before serving traffic."""
+        self.qdrant_repo.warm_up()
+        try:
+            self.embedding_client.generate_single_embedding("warm up")
+        except Exception as e:
+            logger.warning(f"Embedding warm-up failed: {e}")
+
+    def close(self) -> None:
+        self.qdrant_repo.close()
 
     def _get_qdrant_collection_name(self, user_id: str) -> str:
         """Get the per-user Qdrant collection name"""
         return f"user_{user_id}"
 
-    async def link_content(self, collection_name: str, files: List[LinkContentItem], user_id: str) -> List[LinkContentResponse]:
+    def link_content(self, collection_name: str, files: List[LinkContentItem], user_id: str) -> List[LinkContentResponse]:
         """
         Link content (files, URLs) to a logical collection (folder).
         Content is stored in user_{user_id} collection with collection_id=collection_name.
@@ -211,7 +224,7 @@ class CollectionService:
         
         return results
 
-    def query_collection(
+    async def query_collection(
         self,
         user_id: str,
         collection_name: str,
@@ -225,17 +238,38 @@ class CollectionService:
         """
         user_collection = self._get_qdrant_collection_name(user_id)
         
-        return self.query_service.search(
-            collection_name=user_collection, 
+        return await self.query_service.search_async(
+            collection_name=user_collection,
             query_text=query_text,
             enable_critic=enable_critic,
             structured_output=structured_output,
             collection_id=collection_name
         )
 
+    def get_collection_embeddings(
+        self,
+        user_id: str,
+        collection_name: str,
+        limit: int = 100,
+        offset: Optional[str] = None,
+        include_vectors: bool = False,
+        vector_dtype: VectorDtype = "fp16"
+    ) -> Dict[str, Any]:
+        """
+        Page through the points of a logical collection in the user's vector store.
+        """
+        user_collection = self._get_qdrant_collection_name(user_id)
+        return self.qdrant_repo.get_all_embeddings(
+            user_collection, limit, offset, include_vectors,
+            collection_id=collection_name, vector_dtype=vector_dtype
+        )
+
     def purge_user_data(self, user_id: str) -> bool:
         """
         Delete the entire Qdrant collection for a user.
         """
         user_collection = self._get_qdrant_collection_name(user_id)
         return self.qdrant_repo.delete_collection(user_collection)
+
+# Global instance
+collection_service = CollectionService()
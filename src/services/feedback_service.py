@@ -1,24 +1,37 @@
-from typing import List
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+import logging
+import threading
 from repositories.feedback_repository import FeedbackRepository
 from utils.embedding_client import EmbeddingClient
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+FLUSH_BATCH_SIZE = 100
+FLUSH_INTERVAL_SECONDS = 1.0
+
 
 class FeedbackService:
     def __init__(self):
         self.feedback_repo = FeedbackRepository()
         self.embedding_client = EmbeddingClient()
+        # Entries are buffered and appended in batches: every FLUSH_BATCH_SIZE
+        # entries, or FLUSH_INTERVAL_SECONDS after the first buffered one
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
 
-    def save_feedback(self, query: str, doc_ids: List[str], label: int, collection: str) -> bool:
-        if not Config.feedback.FEEDBACK_ENABLED:
-            return False
+    def accepts(self, label: int) -> bool:
+        return Config.feedback.FEEDBACK_ENABLED and label in [0, 1]
 
-        if label not in [0, 1]:
+    def save_feedback(self, query: str, doc_ids: List[str], label: int, collection: str) -> bool:
+        if not self.accepts(label):
             return False
 
         try:
             query_vector = self.embedding_client.generate_single_embedding(query)
-            return self.feedback_repo.save_feedback(
+            entry = self.feedback_repo.build_entry(
                 query=query,
                 query_vector=query_vector,
                 doc_ids=doc_ids,
@@ -28,5 +41,33 @@ class FeedbackService:
         except Exception:
             return False
 
+        with self._lock:
+            self._pending.append(entry)
+            if len(self._pending) < FLUSH_BATCH_SIZE:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(FLUSH_INTERVAL_SECONDS, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return True
+
+        return self.flush()
+
+    def flush(self) -> bool:
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            entries = list(self._pending)
+            self._pending.clear()
+
+        if not entries:
+            return True
+
+        if not self.feedback_repo.save_feedback_batch(entries):
+            logger.error(f"Failed to persist {len(entries)} feedback entries")
+            return False
+        return True
+
     def get_feedback_stats(self, collection: str = None):
-        return self.feedback_repo.get_feedback_stats(collection)
\ No newline at end of file
+        self.flush()
+        return self.feedback_repo.get_feedback_stats(collection)
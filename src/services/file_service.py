@@ -5,23 +5,33 @@ import os
 import io
 import uuid
 import glob
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
 import pdfplumber
-from typing import List, Optional, Tuple, BinaryIO, Generator
+from typing import Any, Dict, List, Optional, Tuple, BinaryIO, Generator
 from fastapi import UploadFile
 
 from models.api_models import FileUploadResponse
 from models.file_types import FileExtensions, UnsupportedFileTypeError
 from services.storage.storage_factory import get_storage_service
-from utils.mime_type_detector import get_content_disposition_filename
+from utils.mime_type_detector import get_content_disposition_filename, get_mime_type
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+UPLOAD_CHUNK_SIZE = 1 << 20  # copy uploads to disk 1 MiB at a time
+PATH_CACHE_SIZE = 16384
+
 class UnifiedFileService:
     def __init__(self):
         self.bucket_prefix = "user-files"
         self.local_storage_path = os.path.join(os.getcwd(), "uploads")
         self.storage_service = get_storage_service()
+        # (user_id, file_id) -> local file path, so repeat lookups skip the directory glob
+        self._path_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._path_cache_lock = threading.Lock()  # routes run in FastAPI's threadpool
         self.ensure_local_storage()
 
     def ensure_local_storage(self):
@@ -45,6 +55,16 @@ class UnifiedFileService:
         try:
             # 1. Try Local Storage Strategy
             if Config.storage.STORAGE_TYPE == "local":
+                with self._path_cache_lock:
+                    cached = self._path_cache.get((user_id, file_id))
+                    if cached is not None:
+                        self._path_cache.move_to_end((user_id, file_id))
+                # A stat is enough to catch deletions made by another worker
+                if cached is not None and os.path.exists(cached):
+                    return f"local://{cached}"
+                if cached is not None:
+                    self._forget_path(user_id, file_id)
+
                 user_dir = os.path.join(self.local_storage_path, user_id)
                 if not os.path.exists(user_dir):
                     return None
@@ -54,6 +74,7 @@ class UnifiedFileService:
                 matches = glob.glob(pattern)
                 
                 if matches:
+                    self._remember_path(user_id, file_id, matches[0])
                     # Return the first match formatted as local:// URI
                     return f"local://{matches[0]}"
             
@@ -75,6 +96,20 @@ class UnifiedFileService:
             logger.error(f"Error finding storage path for {file_id}: {e}")
             return None
 
+    def _remember_path(self, user_id: str, file_id: str, local_path: str) -> None:
+        with self._path_cache_lock:
+            self._path_cache[(user_id, file_id)] = local_path
+            self._path_cache.move_to_end((user_id, file_id))
+            if len(self._path_cache) > PATH_CACHE_SIZE:
+                self._path_cache.popitem(last=False)
+
+    def _forget_path(self, user_id: str, file_id: str) -> None:
+        with self._path_cache_lock:
+            self._path_cache.pop((user_id, file_id), None)
+
+    def file_exists(self, file_id: str, user_id: str) -> bool:
+        return self._find_storage_path(user_id, file_id) is not None
+
     def get_local_file_for_processing(self, file_id: str, user_id: Optional[str]) -> Optional[str]:
         try:
             if not user_id: 
@@ -103,6 +138,65 @@ class UnifiedFileService:
             logger.error(f"Failed to get local file for processing: {e}", exc_info=True)
             return None
 
+    def resolve_file_content(self, file_id: str, user_id: Optional[str]) -> Optional[Tuple[str, str, str, bool]]:
+        """
+        Resolve a stored file to a local path that can be served as-is.
+
+        Returns:
+            (local_path, content_type, filename, is_temporary) or None if not found.
+            is_temporary is True when the file was downloaded from remote storage
+            and should be removed once the response has been sent.
+        """
+        try:
+            if not user_id:
+                return None
+
+            storage_path = self._find_storage_path(user_id, file_id)
+            if not storage_path:
+                return None
+
+            if self._is_local_storage(storage_path):
+                local_path, is_temporary = self.get_local_path(storage_path), False
+            else:
+                local_path, is_temporary = self.storage_service.download_for_processing(storage_path), True
+            if not local_path or not os.path.exists(local_path):
+                return None
+
+            return local_path, get_mime_type(storage_path), get_content_disposition_filename(storage_path), is_temporary
+
+        except Exception as e:
+            logger.error(f"Failed to resolve file content for {file_id}: {e}")
+            return None
+
+    def get_file_etag(self, file_id: str, user_id: Optional[str]) -> Optional[str]:
+        """
+        Build a strong ETag from the stored object's metadata, without downloading it.
+
+        Returns:
+            The quoted ETag, or None if the file is not found.
+        """
+        try:
+            if not user_id:
+                return None
+
+            storage_path = self._find_storage_path(user_id, file_id)
+            if not storage_path:
+                return None
+
+            if self._is_local_storage(storage_path):
+                stat = os.stat(self.get_local_path(storage_path))
+                version = f"{stat.st_size}:{stat.st_mtime_ns}"
+            else:
+                _, size = self.storage_service.get_content_type_and_size(storage_path)
+                version = str(size)
+
+            digest = hashlib.blake2b(f"{storage_path}:{version}".encode(), digest_size=16).hexdigest()
+            return f'"{digest}"'
+
+        except Exception as e:
+            logger.error(f"Failed to build ETag for {file_id}: {e}")
+            return None
+
     def get_file_content(self, file_id: str, user_id: Optional[str]) -> Optional[str]:
         try:
             if not user_id: return None
@@ -178,8 +272,7 @@ class UnifiedFileService:
                 return self._upload_to_local_storage(file, "system")
 
             file_id = str(uuid.uuid4())
-            file_content = file.file.read()
-            
+
             # Generate storage path: uploads/{user_id}/{file_id}_{filename}
             if Config.storage.STORAGE_TYPE == "local":
                 user_dir = os.path.join(self.local_storage_path, user_id)
@@ -189,21 +282,26 @@ class UnifiedFileService:
                 storage_path = f"local://{local_file_path}"
                 
                 with open(local_file_path, "wb") as f:
-                    f.write(file_content)
+                    shutil.copyfileobj(file.file, f, UPLOAD_CHUNK_SIZE)
+                self._remember_path(user_id, file_id, local_file_path)
+                file_size = os.path.getsize(local_file_path)
                 
                 success = True
             else:
                 # Remote
                 object_name = f"{user_id}/{file_id}_{file.filename}"
                 storage_path = f"{self.bucket_prefix}/{object_name}"
-                success = self.storage_service.upload_file(file_content, storage_path)
+                # Remote storage backends take the payload as bytes
+                data = file.file.read()
+                file_size = len(data)
+                success = self.storage_service.upload_file(data, storage_path)
 
             if success:
                 # No DB insert
                 return FileUploadResponse(
                     status="SUCCESS",
                     message="File uploaded successfully",
-                    body={"file_id": file_id}
+                    body=self._stored_file_record(file_id, file.filename, file_size)
                 )
             else:
                 return FileUploadResponse(status="FAILURE", message="Upload failed", body={})
@@ -221,16 +319,30 @@ class UnifiedFileService:
             
             local_file_path = os.path.join(user_dir, local_filename)
             with open(local_file_path, "wb") as f:
-                f.write(file.file.read())
+                shutil.copyfileobj(file.file, f, UPLOAD_CHUNK_SIZE)
 
             return FileUploadResponse(
                 status="SUCCESS",
                 message="File uploaded locally",
-                body={"file_id": file_id}
+                body=self._stored_file_record(file_id, file.filename, os.path.getsize(local_file_path))
             )
         except Exception as e:
             return FileUploadResponse(status="FAILURE", message=str(e), body={})
 
+    def _stored_file_record(self, file_id: str, filename: str, file_size: int) -> Dict[str, Any]:
+        """Listing fields for a just-stored file, so clients can show it without re-listing."""
+        record = {
+            "file_id": file_id,
+            "filename": filename,
+            "file_size": file_size,
+            "upload_date": datetime.now(timezone.utc).isoformat(),
+        }
+        try:
+            record["file_type"] = self.detect_file_type(filename)
+        except UnsupportedFileTypeError:
+            pass
+        return record
+
     # Legacy cleanup helper
     def delete_file(self, file_id: str, user_id: str) -> bool:
         # Without DB, we use _find_storage_path and delete file
@@ -238,6 +350,7 @@ class UnifiedFileService:
         if path and self._is_local_storage(path):
             try:
                 os.remove(self.get_local_path(path))
+                self._forget_path(user_id, file_id)
                 return True
             except (FileNotFoundError, IOError, OSError) as e:
                 logger.error(f"Failed to delete file at path {path}: {e}")
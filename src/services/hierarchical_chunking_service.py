@@ -4,12 +4,8 @@ import logging
 import os
 from typing import List, Dict, Any, Optional, Tuple
 import pdfplumber
-from models.api_models import (
-    HierarchicalChunk,
-    ChunkType,
-    TopicMetadata,
-    ChunkMetadata
-)
+from models.api_models import ChunkType
+from models.internal_chunk import HierarchicalChunk, TopicMetadata, ChunkMetadata
 from parsers.models import ParsedContent, ContentSection
 
 logger = logging.getLogger(__name__)
@@ -1,21 +1,22 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from repositories.qdrant_repository import QdrantRepository
 from repositories.feedback_repository import FeedbackRepository
-from utils.embedding_client import embedding_client
+from utils.embedding_client import embedding_client, embedding_batcher
 from utils.llm_client import LlmClient
 from utils.response_enhancer import enhance_response_if_needed
 from models.api_models import QueryResponse, ChunkConfig, CriticEvaluation, ChunkType
 from core.reranker import reranker
 from core.critic import critic
 from config import Config
+import asyncio
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
 class QueryService:
-    def __init__(self):
-        self.qdrant_repo = QdrantRepository()
+    def __init__(self, qdrant_repo: Optional[QdrantRepository] = None):
+        self.qdrant_repo = qdrant_repo or QdrantRepository()
         self.embedding_client = embedding_client  # Use global cached instance
         self.llm_client = LlmClient()
         self.feedback_repo = FeedbackRepository()
@@ -93,40 +94,63 @@ class QueryService:
         For problem queries: Prioritize questions and examples
         For general queries: Mix all types
         """
+        plan = self._retrieval_plan(query_text, limit)
+        result_sets = [
+            self.qdrant_repo.query_collection(
+                collection_name, query_vector, limit=chunk_limit, chunk_type=chunk_type, collection_id=collection_id
+            )
+            for chunk_limit, chunk_type in plan
+        ]
+        return self._combine_retrieval_results(result_sets, limit)
+
+    async def _smart_chunk_retrieval_async(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        query_text: str,
+        limit: int = 10,
+        collection_id: Optional[str] = None
+    ) -> List[Dict]:
+        """Same as _smart_chunk_retrieval, with the per-type queries issued concurrently."""
+        plan = self._retrieval_plan(query_text, limit)
+        result_sets = await asyncio.gather(*[
+            asyncio.to_thread(
+                self.qdrant_repo.query_collection,
+                collection_name, query_vector, limit=chunk_limit, chunk_type=chunk_type, collection_id=collection_id
+            )
+            for chunk_limit, chunk_type in plan
+        ])
+        return self._combine_retrieval_results(list(result_sets), limit)
+
+    def _retrieval_plan(self, query_text: str, limit: int) -> List[Tuple[int, Optional[str]]]:
+        """(limit, chunk_type) for each Qdrant query the detected intent calls for."""
         intent = self._detect_query_intent(query_text)
 
         if not intent:
             # No specific intent - get diverse results
-            return self.qdrant_repo.query_collection(
-                collection_name, query_vector, limit, collection_id=collection_id
-            )
+            return [(limit, None)]
 
-        # Get chunks of the prioritized type
-        primary_results = self.qdrant_repo.query_collection(
-            collection_name, query_vector, limit=limit//2, chunk_type=intent, collection_id=collection_id
-        )
-
-        # Get supporting chunks based on intent
+        # Supporting chunk type for each intent
         if intent == ChunkType.CONCEPT.value:
             # For concept queries, also get examples to illustrate
-            secondary_results = self.qdrant_repo.query_collection(
-                collection_name, query_vector, limit=limit//2, chunk_type=ChunkType.EXAMPLE.value, collection_id=collection_id
-            )
+            secondary_type = ChunkType.EXAMPLE.value
         elif intent == ChunkType.EXAMPLE.value:
             # For example queries, also get concepts for context
-            secondary_results = self.qdrant_repo.query_collection(
-                collection_name, query_vector, limit=limit//2, chunk_type=ChunkType.CONCEPT.value, collection_id=collection_id
-            )
+            secondary_type = ChunkType.CONCEPT.value
         elif intent == ChunkType.QUESTION.value:
             # For problem queries, get examples showing solutions
-            secondary_results = self.qdrant_repo.query_collection(
-                collection_name, query_vector, limit=limit//2, chunk_type=ChunkType.EXAMPLE.value, collection_id=collection_id
-            )
+            secondary_type = ChunkType.EXAMPLE.value
         else:
-            secondary_results = []
+            return [(limit//2, intent)]
+
+        return [(limit//2, intent), (limit//2, secondary_type)]
+
+    def _combine_retrieval_results(self, result_sets: List[List[Dict]], limit: int) -> List[Dict]:
+        if len(result_sets) == 1 and len(result_sets[0]) <= limit:
+            return result_sets[0]
 
         # Combine and sort by relevance
-        combined = primary_results + secondary_results
+        combined = [result for results in result_sets for result in results]
         combined.sort(key=lambda x: x.get("score", 0), reverse=True)
         return combined[:limit]
 
@@ -224,14 +248,36 @@ class QueryService:
         if not Config.feedback.FEEDBACK_ENABLED or not results:
             return results
 
+        return self._score_with_feedback(results, self._get_relevant_feedback(query_vector, collection_name))
+
+    def _get_relevant_feedback(self, query_vector: List[float], collection_name: str) -> Optional[List]:
+        return self._rank_feedback(query_vector, self._load_feedback(collection_name))
+
+    def _load_feedback(self, collection_name: str) -> Optional[List]:
+        if not Config.feedback.FEEDBACK_ENABLED:
+            return None
+
+        try:
+            return self.feedback_repo.load_feedback(collection_name)
+        except Exception:
+            return None
+
+    def _rank_feedback(self, query_vector: List[float], entries: Optional[List]) -> Optional[List]:
+        if not entries:
+            return None
+
         try:
-            relevant_feedback = self.feedback_repo.get_relevant_feedback(
-                query_vector, collection_name, Config.feedback.FEEDBACK_SIMILARITY_THRESHOLD
+            return self.feedback_repo.rank_feedback(
+                query_vector, entries, Config.feedback.FEEDBACK_SIMILARITY_THRESHOLD
             )
+        except Exception:
+            return None
 
-            if not relevant_feedback:
-                return results
+    def _score_with_feedback(self, results: List[Dict], relevant_feedback: Optional[List]) -> List[Dict]:
+        if not relevant_feedback or not results:
+            return results
 
+        try:
             doc_ids = [result.get("payload", {}).get("document_id", "") for result in results]
             feedback_scores = self.feedback_repo.calculate_feedback_scores(doc_ids, relevant_feedback)
 
@@ -283,6 +329,55 @@ class QueryService:
             return self._create_query_response(results, query_text, enable_critic, structured_output)
 
         except Exception as e:
+            logger.error(f"Error in query search: {str(e)}")
+            return QueryResponse(
+                answer="Context not found",
+                confidence=0.0,
+                is_relevant=False,
+                chunks=[]
+            )
+
+    async def _rerank_async(self, query_text: str, results: List[Dict]) -> List[Dict]:
+        if not (reranker.is_available() and results):
+            return results
+        return await asyncio.to_thread(reranker.rerank, query_text, results)
+
+    async def _rank_feedback_async(self, query_vector: List[float], entries: Optional[List]) -> Optional[List]:
+        if not entries:
+            return None
+        return await asyncio.to_thread(self._rank_feedback, query_vector, entries)
+
+    async def search_async(self, collection_name: str, query_text: str, limit: int = 10, enable_critic: bool = True, structured_output: bool = False, collection_id: Optional[str] = None) -> QueryResponse:
+        """
+        Async variant of search() for the API hot path.
+
+        Stored feedback is read while the query is being embedded, the
+        chunk-type queries run concurrently once the vector is ready, and
+        reranking overlaps with ranking the stored feedback; blocking
+        client calls run in worker threads to keep the event loop free.
+        """
+        feedback_task = asyncio.ensure_future(asyncio.to_thread(self._load_feedback, collection_name))
+        try:
+            # Concurrent queries share one batched forward pass through the model
+            query_vector = await embedding_batcher.submit(query_text)
+
+            results, feedback_entries = await asyncio.gather(
+                self._smart_chunk_retrieval_async(collection_name, query_vector, query_text, limit, collection_id=collection_id),
+                feedback_task
+            )
+
+            # Reranking and feedback ranking are independent until they are combined
+            results, relevant_feedback = await asyncio.gather(
+                self._rerank_async(query_text, results),
+                self._rank_feedback_async(query_vector, feedback_entries)
+            )
+
+            results = self._score_with_feedback(results, relevant_feedback)
+
+            return await asyncio.to_thread(self._create_query_response, results, query_text, enable_critic, structured_output)
+
+        except Exception as e:
+            feedback_task.cancel()
             logger.error(f"Error in query search: {str(e)}")
             return QueryResponse(
                 answer="Context not found",
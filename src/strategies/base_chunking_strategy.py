@@ -7,7 +7,8 @@ Defines the interface that all concrete chunking strategies must implement.
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 import logging
-from models.api_models import HierarchicalChunk, ChunkingStrategy, ContentType, BookMetadata
+from models.api_models import ChunkingStrategy, ContentType, BookMetadata
+from models.internal_chunk import HierarchicalChunk
 
 logger = logging.getLogger(__name__)
 
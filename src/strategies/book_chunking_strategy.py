@@ -10,7 +10,8 @@ import logging
 from typing import List, Dict, Any, Optional
 import pdfplumber
 from strategies.base_chunking_strategy import BaseChunkingStrategy
-from models.api_models import HierarchicalChunk, ContentType, BookMetadata
+from models.api_models import ContentType, BookMetadata
+from models.internal_chunk import HierarchicalChunk
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +13,8 @@ from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 
 from strategies.base_chunking_strategy import BaseChunkingStrategy
-from models.api_models import HierarchicalChunk, ContentType, BookMetadata, ChunkType, TopicMetadata, ChunkMetadata
+from models.api_models import ContentType, BookMetadata, ChunkType
+from models.internal_chunk import HierarchicalChunk, TopicMetadata, ChunkMetadata
 from config import SemanticChunkingConfig
 
 logger = logging.getLogger(__name__)
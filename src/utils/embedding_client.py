@@ -1,6 +1,7 @@
 from sentence_transformers import SentenceTransformer
-from typing import List
+from typing import List, Optional, Tuple
 from config import Config
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -29,5 +30,65 @@ class EmbeddingClient:
         return embedding.tolist()
 
 
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent single-text embedding requests into one batched encode.
+
+    Requests arriving within ``max_wait`` seconds of each other (up to
+    ``max_batch`` of them) share a single forward pass, run in a worker thread.
+    """
+
+    def __init__(self, client: EmbeddingClient, max_batch: int = 32, max_wait: float = 0.005):
+        self.client = client
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, text: str) -> List[float]:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run(self._queue))
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = [await queue.get()]
+            await asyncio.sleep(self.max_wait)
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            # Callers that were cancelled while waiting don't need a vector
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            try:
+                embeddings = await asyncio.to_thread(self.client.generate_embeddings, [text for text, _ in batch])
+            except Exception as e:
+                logger.error(f"Batched embedding failed for {len(batch)} texts: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
+
 # Create a global instance for reuse
-embedding_client = EmbeddingClient()
\ No newline at end of file
+embedding_client = EmbeddingClient()
+embedding_batcher = EmbeddingBatcher(embedding_client)
\ No newline at end of file
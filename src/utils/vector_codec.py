@@ -0,0 +1,37 @@
+"""
+Compact wire encodings for embedding vectors returned by the API.
+"""
+
+import base64
+from typing import Any, Dict, List, Literal, Union
+
+import numpy as np
+
+VectorDtype = Literal["fp32", "fp16", "int8"]
+
+
+def encode_vector(vector: List[float], dtype: VectorDtype) -> Union[List[float], Dict[str, Any]]:
+    """
+    Encode a vector for a JSON response.
+
+    Args:
+        vector: Raw float vector as returned by Qdrant
+        dtype: "fp32" keeps the plain float list; "fp16" and "int8" return
+            base64-encoded little-endian bytes (int8 carries a per-vector scale,
+            original ~= int8_value * scale)
+
+    Returns:
+        Float list for fp32, otherwise {"dtype", "data"[, "scale"]}
+    """
+    if dtype == "fp32":
+        return vector
+
+    values = np.asarray(vector, dtype=np.float32)
+
+    if dtype == "fp16":
+        return {"dtype": "fp16", "data": base64.b64encode(values.astype("<f2").tobytes()).decode("ascii")}
+
+    max_abs = float(np.abs(values).max()) if values.size else 0.0
+    scale = max_abs / 127 if max_abs else 1.0
+    quantized = np.clip(np.rint(values / scale), -127, 127).astype(np.int8)
+    return {"dtype": "int8", "data": base64.b64encode(quantized.tobytes()).decode("ascii"), "scale": scale}
@@ -1,5 +1,6 @@
 """Pytest configuration and shared fixtures"""
 import json
+import sys
 import pytest
 from typing import Dict, List, Any
 from pathlib import Path
@@ -7,6 +8,11 @@ from pathlib import Path
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Application modules import each other from src/, as app.py sets up
+SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
 
 @pytest.fixture
 def mock_chunks() -> List[Dict[str, Any]]:
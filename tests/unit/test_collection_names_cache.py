@@ -0,0 +1,62 @@
+"""Unit tests for the Qdrant collection-name cache"""
+from types import SimpleNamespace
+
+import pytest
+
+qdrant_repository = pytest.importorskip("repositories.qdrant_repository")
+
+
+class FakeClient:
+    def __init__(self, names):
+        self.names = set(names)
+        self.calls = 0
+
+    def get_collections(self):
+        self.calls += 1
+        return SimpleNamespace(collections=[SimpleNamespace(name=name) for name in self.names])
+
+    def create_collection(self, collection_name, **kwargs):
+        raise RuntimeError("already exists")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(qdrant_repository.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def repo():
+    # Skip __init__: it connects to Qdrant
+    repo = qdrant_repository.QdrantRepository.__new__(qdrant_repository.QdrantRepository)
+    repo.client = FakeClient({"user_a"})
+    repo._collection_names = None
+    repo._collection_names_lock = qdrant_repository.threading.Lock()
+    return repo
+
+
+class TestCollectionNamesCache:
+    """TTL expiry, refresh and invalidation"""
+
+    def test_cached_within_ttl(self, repo, clock):
+        assert repo.collection_exists("user_a")
+        clock[0] += qdrant_repository.COLLECTION_NAMES_TTL_SECONDS / 2
+        assert repo.collection_exists("user_a")
+        assert repo.client.calls == 1
+
+    def test_expires_after_ttl(self, repo, clock):
+        assert not repo.collection_exists("user_b")
+        repo.client.names.add("user_b")
+        clock[0] += qdrant_repository.COLLECTION_NAMES_TTL_SECONDS
+        assert repo.collection_exists("user_b")
+        assert repo.client.calls == 2
+
+    def test_refresh_bypasses_cache(self, repo, clock):
+        assert not repo.collection_exists("user_b")
+        repo.client.names.add("user_b")
+        assert repo.collection_exists("user_b", refresh=True)
+
+    def test_failed_create_invalidates(self, repo, clock):
+        assert not repo.create_user_collection("b")
+        assert repo._collection_names is None
@@ -0,0 +1,53 @@
+"""Unit tests for conditional requests on file content"""
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+files_routes = pytest.importorskip("api.routes.files")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+ETAG = '"0123456789abcdef0123456789abcdef"'
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    stored = tmp_path / "doc.txt"
+    stored.write_text("hello")
+    resolved = []
+
+    def resolve_file_content(file_id, user_id):
+        resolved.append(file_id)
+        return str(stored), "text/plain", "doc.txt", False
+
+    monkeypatch.setattr(files_routes.file_service, "get_file_etag", lambda file_id, user_id: ETAG)
+    monkeypatch.setattr(files_routes.file_service, "resolve_file_content", resolve_file_content)
+
+    app = FastAPI()
+    app.include_router(files_routes.router)
+    test_client = TestClient(app)
+    test_client.resolved = resolved
+    return test_client
+
+
+class TestFileContentETag:
+    """ETag is checked before the file is resolved"""
+
+    def test_matching_etag_returns_304_without_resolving(self, client):
+        response = client.get("/files/abc/content", headers={"X-User-Id": "u1", "If-None-Match": ETAG})
+        assert response.status_code == 304
+        assert response.headers["etag"] == ETAG
+        assert client.resolved == []
+
+    def test_stale_etag_returns_body(self, client):
+        response = client.get("/files/abc/content", headers={"X-User-Id": "u1", "If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.headers["etag"] == ETAG
+        assert response.text == "hello"
+        assert client.resolved == ["abc"]
+
+    def test_missing_file_returns_404(self, client, monkeypatch):
+        monkeypatch.setattr(files_routes.file_service, "get_file_etag", lambda file_id, user_id: None)
+        response = client.get("/files/abc/content", headers={"X-User-Id": "u1"})
+        assert response.status_code == 404
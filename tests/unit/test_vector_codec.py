@@ -0,0 +1,36 @@
+"""Unit tests for the embedding vector wire encodings"""
+import base64
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from utils.vector_codec import encode_vector
+
+
+VECTOR = [0.5, -1.25, 0.0, 3.0, -0.001]
+
+
+class TestEncodeVector:
+    """Round trips for each supported dtype"""
+
+    def test_fp32_returns_plain_list(self):
+        assert encode_vector(VECTOR, "fp32") == VECTOR
+
+    def test_fp16_round_trip(self):
+        encoded = encode_vector(VECTOR, "fp16")
+        assert encoded["dtype"] == "fp16"
+        decoded = np.frombuffer(base64.b64decode(encoded["data"]), dtype="<f2")
+        np.testing.assert_allclose(decoded, VECTOR, rtol=1e-3, atol=1e-3)
+
+    def test_int8_round_trip(self):
+        encoded = encode_vector(VECTOR, "int8")
+        assert encoded["dtype"] == "int8"
+        assert encoded["scale"] == pytest.approx(3.0 / 127)
+        decoded = np.frombuffer(base64.b64decode(encoded["data"]), dtype=np.int8) * encoded["scale"]
+        np.testing.assert_allclose(decoded, VECTOR, atol=encoded["scale"] / 2 + 1e-9)
+
+    def test_int8_zero_vector(self):
+        encoded = encode_vector([0.0, 0.0], "int8")
+        assert encoded["scale"] == 1.0
+        assert np.frombuffer(base64.b64decode(encoded["data"]), dtype=np.int8).tolist() == [0, 0]